@@ -0,0 +1,35 @@
+"""Compress event version snapshots with lz4
+
+Revision ID: 3a9c5e1f7b64
+Revises: 8e4f2a6c1d07
+Create Date: 2026-10-14 09:26:48.517390
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '3a9c5e1f7b64'
+down_revision = '8e4f2a6c1d07'
+branch_labels = None
+depends_on = None
+
+# Only applies when the server was built with lz4 (PostgreSQL 14+). Rows
+# already stored keep their compression; new and updated values use lz4.
+_SET_COMPRESSION = """
+DO $$ BEGIN
+    IF EXISTS (SELECT 1 FROM pg_settings
+               WHERE name = 'default_toast_compression' AND 'lz4' = ANY(enumvals)) THEN
+        ALTER TABLE event_versions ALTER COLUMN data SET COMPRESSION {method};
+    END IF;
+END $$;
+"""
+
+
+def upgrade():
+    op.execute(_SET_COMPRESSION.format(method='lz4'))
+
+
+def downgrade():
+    op.execute(_SET_COMPRESSION.format(method='default'))
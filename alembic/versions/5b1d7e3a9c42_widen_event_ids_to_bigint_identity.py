@@ -0,0 +1,62 @@
+"""Widen event ids to BIGINT identity columns
+
+Revision ID: 5b1d7e3a9c42
+Revises: c0e92f5e9721
+Create Date: 2026-10-14 09:12:41.204518
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '5b1d7e3a9c42'
+down_revision = 'c0e92f5e9721'
+branch_labels = None
+depends_on = None
+
+# Tables whose serial primary keys become identity columns, with the
+# foreign keys to events.id that have to widen alongside them
+_ID_TABLES = {
+    'events': [],
+    'event_permissions': ['event_id'],
+    'event_versions': ['event_id'],
+}
+
+
+def _restart_sequence(table):
+    # Continue numbering after the rows that are already there
+    op.execute(
+        f"SELECT setval(pg_get_serial_sequence('{table}', 'id'), "
+        f"COALESCE(MAX(id), 0) + 1, false) FROM {table}"
+    )
+
+
+def upgrade():
+    for table, fk_columns in _ID_TABLES.items():
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN id DROP DEFAULT")
+        op.execute(f"DROP SEQUENCE IF EXISTS {table}_id_seq")
+        # One ALTER TABLE per table so each is rewritten only once
+        columns = ['id'] + fk_columns
+        op.execute(
+            f"ALTER TABLE {table} "
+            + ", ".join(f"ALTER COLUMN {column} TYPE BIGINT" for column in columns)
+        )
+        op.execute(
+            f"ALTER TABLE {table} ALTER COLUMN id "
+            "ADD GENERATED BY DEFAULT AS IDENTITY (CACHE 1000)"
+        )
+        _restart_sequence(table)
+
+
+def downgrade():
+    for table, fk_columns in reversed(list(_ID_TABLES.items())):
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN id DROP IDENTITY IF EXISTS")
+        columns = ['id'] + fk_columns
+        op.execute(
+            f"ALTER TABLE {table} "
+            + ", ".join(f"ALTER COLUMN {column} TYPE INTEGER" for column in columns)
+        )
+        op.execute(f"CREATE SEQUENCE {table}_id_seq AS INTEGER OWNED BY {table}.id")
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN id SET DEFAULT nextval('{table}_id_seq')")
+        _restart_sequence(table)
@@ -0,0 +1,35 @@
+"""Store event JSON columns as JSONB
+
+Revision ID: 8e4f2a6c1d07
+Revises: 5b1d7e3a9c42
+Create Date: 2026-10-14 09:20:05.931772
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = '8e4f2a6c1d07'
+down_revision = '5b1d7e3a9c42'
+branch_labels = None
+depends_on = None
+
+# Version diffs use jsonb_object_keys and jsonb equality on these columns
+_JSON_COLUMNS = [
+    ('events', 'recurrence_rule'),
+    ('event_versions', 'data'),
+]
+
+
+def upgrade():
+    for table, column in _JSON_COLUMNS:
+        op.alter_column(table, column, type_=postgresql.JSONB(),
+                        postgresql_using=f'{column}::jsonb')
+
+
+def downgrade():
+    for table, column in _JSON_COLUMNS:
+        op.alter_column(table, column, type_=postgresql.JSON(),
+                        postgresql_using=f'{column}::json')
@@ -16,36 +16,74 @@ branch_labels = None
 depends_on = None
 
 
+# Enum types shared by every column that uses them. create_type=False stops
+# create_table from emitting its own CREATE TYPE; _create_enum and
+# _drop_enum manage the types from these same definitions.
+userrole_type = postgresql.ENUM('owner', 'editor', 'viewer', name='userrole', create_type=False)
+recurrence_pattern_type = postgresql.ENUM('none', 'daily', 'weekly', 'monthly', 'yearly', 'custom',
+                                          name='recurrencepattern', create_type=False)
+
+
+def _table_exists(conn, name):
+    """Check for a table by name without reflecting the whole schema."""
+    return conn.execute(sa.text("SELECT to_regclass(:t) IS NOT NULL"), {"t": name}).scalar()
+
+
+def _create_enum(enum_type):
+    """Create an enum type in one statement, ignoring it if it already exists."""
+    labels = ", ".join(f"'{value}'" for value in enum_type.enums)
+    op.execute(
+        f"DO $$ BEGIN CREATE TYPE {enum_type.name} AS ENUM ({labels}); "
+        f"EXCEPTION WHEN duplicate_object THEN NULL; END $$;"
+    )
+
+
+def _drop_enum(enum_type):
+    """Drop an enum type if it exists."""
+    op.execute(f"DROP TYPE IF EXISTS {enum_type.name}")
+
+
+# Foreign keys per table, added after all tables and indexes exist:
+# (name, source table, referent table, local columns, remote columns, ondelete)
+_FOREIGN_KEYS = {
+    'events': [
+        ('events_owner_id_fkey', 'events', 'users', ['owner_id'], ['id'], None),
+    ],
+    'event_permissions': [
+        ('event_permissions_event_id_fkey', 'event_permissions', 'events', ['event_id'], ['id'], 'CASCADE'),
+        ('event_permissions_user_id_fkey', 'event_permissions', 'users', ['user_id'], ['id'], 'CASCADE'),
+    ],
+    'event_versions': [
+        ('event_versions_changed_by_id_fkey', 'event_versions', 'users', ['changed_by_id'], ['id'], None),
+        ('event_versions_event_id_fkey', 'event_versions', 'events', ['event_id'], ['id'], 'CASCADE'),
+    ],
+}
+
+
 def upgrade():
-    # Check if tables already exist
     conn = op.get_bind()
-    inspector = sa.inspect(conn)
-    existing_tables = inspector.get_table_names()
     
-    # Only proceed if tables don't exist
-    if 'events' not in existing_tables:
-        # Check if enum types exist before creating
-        has_userrole = False
-        has_recurrencepattern = False
-        
-        for enum in inspector.get_enums():
-            if enum['name'] == 'userrole':
-                has_userrole = True
-            elif enum['name'] == 'recurrencepattern':
-                has_recurrencepattern = True
-        
-        # Create UserRole enum type if it doesn't exist
-        if not has_userrole:
-            userrole_type = postgresql.ENUM('owner', 'editor', 'viewer', name='userrole')
-            userrole_type.create(conn, checkfirst=True)
-        
-        # Create RecurrencePattern enum type if it doesn't exist
-        if not has_recurrencepattern:
-            recurrence_pattern_type = postgresql.ENUM('none', 'daily', 'weekly', 'monthly', 'yearly', 'custom', 
-                                                 name='recurrencepattern')
-            recurrence_pattern_type.create(conn, checkfirst=True)
+    _create_enum(userrole_type)
+    _create_enum(recurrence_pattern_type)
+    
+    # Only build tables that don't exist yet
+    new_tables = [name for name in _TABLES if not _table_exists(conn, name)]
     
-    # Create events table
+    # Tables first, then indexes, then foreign keys, so constraints are
+    # validated against finished indexes rather than maintained row by row
+    for name in new_tables:
+        _TABLES[name]()
+    
+    for name in new_tables:
+        _INDEXES[name]()
+    
+    for name in new_tables:
+        for fk_name, source, referent, local_cols, remote_cols, ondelete in _FOREIGN_KEYS[name]:
+            op.create_foreign_key(fk_name, source, referent, local_cols, remote_cols, ondelete=ondelete)
+
+
+def _create_events():
+    """Create the events table."""
     op.create_table('events',
         sa.Column('id', sa.Integer(), nullable=False),
         sa.Column('title', sa.String(), nullable=False),
@@ -54,36 +92,44 @@ def upgrade():
         sa.Column('end_time', sa.DateTime(timezone=True), nullable=False),
         sa.Column('location', sa.String(), nullable=True),
         sa.Column('is_recurring', sa.Boolean(), nullable=False, default=False),
-        sa.Column('recurrence_pattern', sa.Enum('none', 'daily', 'weekly', 'monthly', 'yearly', 'custom', 
-                                                name='recurrencepattern'), default='none'),
+        sa.Column('recurrence_pattern', recurrence_pattern_type, default='none'),
         sa.Column('recurrence_rule', postgresql.JSON(), nullable=True),
         sa.Column('owner_id', sa.Integer(), nullable=False),
         sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
         sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
         sa.Column('version', sa.Integer(), default=1, nullable=False),
-        sa.ForeignKeyConstraint(['owner_id'], ['users.id'], ),
         sa.PrimaryKeyConstraint('id')
     )
+
+
+def _create_events_indexes():
+    """Create the secondary indexes on events."""
     op.create_index(op.f('ix_events_id'), 'events', ['id'], unique=False)
     op.create_index(op.f('ix_events_title'), 'events', ['title'], unique=False)
     op.create_index(op.f('ix_events_start_time'), 'events', ['start_time'], unique=False)
     op.create_index(op.f('ix_events_end_time'), 'events', ['end_time'], unique=False)
-    
-    # Create event_permissions table
+
+
+def _create_event_permissions():
+    """Create the event_permissions table."""
     op.create_table('event_permissions',
         sa.Column('id', sa.Integer(), nullable=False),
         sa.Column('event_id', sa.Integer(), nullable=False),
         sa.Column('user_id', sa.Integer(), nullable=False),
-        sa.Column('role', sa.Enum('owner', 'editor', 'viewer', name='userrole'), nullable=False),
+        sa.Column('role', userrole_type, nullable=False),
         sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
         sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
-        sa.ForeignKeyConstraint(['event_id'], ['events.id'], ondelete='CASCADE'),
-        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
         sa.PrimaryKeyConstraint('id')
     )
+
+
+def _create_event_permissions_indexes():
+    """Create the secondary indexes on event_permissions."""
     op.create_index(op.f('ix_event_permissions_id'), 'event_permissions', ['id'], unique=False)
-    
-    # Create event_versions table
+
+
+def _create_event_versions():
+    """Create the event_versions table."""
     op.create_table('event_versions',
         sa.Column('id', sa.Integer(), nullable=False),
         sa.Column('event_id', sa.Integer(), nullable=False),
@@ -92,44 +138,53 @@ def upgrade():
         sa.Column('changed_by_id', sa.Integer(), nullable=False),
         sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
         sa.Column('change_description', sa.Text(), nullable=True),
-        sa.ForeignKeyConstraint(['changed_by_id'], ['users.id'], ),
-        sa.ForeignKeyConstraint(['event_id'], ['events.id'], ondelete='CASCADE'),
         sa.PrimaryKeyConstraint('id'),
         sa.UniqueConstraint('event_id', 'version', name='uix_event_version')
     )
+
+
+def _create_event_versions_indexes():
+    """Create the secondary indexes on event_versions."""
     op.create_index(op.f('ix_event_versions_id'), 'event_versions', ['id'], unique=False)
 
 
+# Creation order matters: referenced tables come first
+_TABLES = {
+    'events': _create_events,
+    'event_permissions': _create_event_permissions,
+    'event_versions': _create_event_versions,
+}
+_INDEXES = {
+    'events': _create_events_indexes,
+    'event_permissions': _create_event_permissions_indexes,
+    'event_versions': _create_event_versions_indexes,
+}
+
+
 def downgrade():
-    # Check if tables exist before dropping
     conn = op.get_bind()
-    inspector = sa.inspect(conn)
-    existing_tables = inspector.get_table_names()
     
-    # Only drop tables that exist
+    # Reverse of upgrade: foreign keys, then indexes, then tables
+    existing_tables = [name for name in reversed(list(_TABLES)) if _table_exists(conn, name)]
+    
+    for name in existing_tables:
+        for fk_name, source, *_ in _FOREIGN_KEYS[name]:
+            op.drop_constraint(fk_name, source, type_='foreignkey')
+    
     if 'event_versions' in existing_tables:
         op.drop_index(op.f('ix_event_versions_id'), table_name='event_versions')
-        op.drop_table('event_versions')
     
     if 'event_permissions' in existing_tables:
         op.drop_index(op.f('ix_event_permissions_id'), table_name='event_permissions')
-        op.drop_table('event_permissions')
     
     if 'events' in existing_tables:
         op.drop_index(op.f('ix_events_end_time'), table_name='events')
         op.drop_index(op.f('ix_events_start_time'), table_name='events')
         op.drop_index(op.f('ix_events_title'), table_name='events')
         op.drop_index(op.f('ix_events_id'), table_name='events')
-        op.drop_table('events')
     
-    # Check if enum types exist before dropping
-    has_enum_types = False
-    for enum in inspector.get_enums():
-        if enum['name'] in ['recurrencepattern', 'userrole']:
-            has_enum_types = True
-            break
+    for name in existing_tables:
+        op.drop_table(name)
     
-    if has_enum_types:
-        # Drop enum types using conditional logic
-        op.execute('DROP TYPE IF EXISTS recurrencepattern')
-        op.execute('DROP TYPE IF EXISTS userrole')
+    _drop_enum(recurrence_pattern_type)
+    _drop_enum(userrole_type)
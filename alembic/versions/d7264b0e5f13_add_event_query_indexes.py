@@ -0,0 +1,79 @@
+"""Add event query indexes
+
+Revision ID: d7264b0e5f13
+Revises: 3a9c5e1f7b64
+Create Date: 2026-10-14 09:34:17.068245
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd7264b0e5f13'
+down_revision = '3a9c5e1f7b64'
+branch_labels = None
+depends_on = None
+
+# The tables already hold data, so the indexes are built CONCURRENTLY to keep
+# writes flowing. That cannot run in a transaction, and a failed build leaves
+# an INVALID index behind, so every step is safe to re-run.
+_INDEXES = {
+    'ix_events_owner_time':
+        'ON events (owner_id, start_time) INCLUDE (end_time, title)',
+    'ix_events_time_range':
+        'ON events USING gist (tstzrange(start_time, end_time))',
+    'ix_event_permissions_event_id':
+        'ON event_permissions (event_id)',
+}
+_UNIQUE_INDEXES = {
+    'ix_event_permissions_user_event':
+        'ON event_permissions (user_id, event_id)',
+}
+_REPLACED_INDEXES = {
+    'ix_events_start_time': 'ON events (start_time)',
+    'ix_events_end_time': 'ON events (end_time)',
+}
+
+
+def _drop_index(name):
+    op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
+
+
+def _create_index(name, definition, unique=False):
+    invalid = op.get_bind().execute(sa.text(
+        "SELECT 1 FROM pg_index JOIN pg_class ON pg_class.oid = pg_index.indexrelid "
+        "WHERE pg_class.relname = :name AND NOT pg_index.indisvalid"
+    ), {'name': name}).first()
+    if invalid:
+        _drop_index(name)
+    op.execute(f"CREATE {'UNIQUE ' if unique else ''}INDEX CONCURRENTLY IF NOT EXISTS {name} {definition}")
+
+
+def upgrade():
+    # Sharing used to check then insert, so concurrent shares could leave
+    # duplicate rows; keep the newest before enforcing one per user and event
+    op.execute("""
+        DELETE FROM event_permissions AS older
+        USING event_permissions AS newer
+        WHERE older.user_id = newer.user_id
+          AND older.event_id = newer.event_id
+          AND older.id < newer.id
+    """)
+
+    with op.get_context().autocommit_block():
+        for name, definition in _INDEXES.items():
+            _create_index(name, definition)
+        for name, definition in _UNIQUE_INDEXES.items():
+            _create_index(name, definition, unique=True)
+        # Owner-scoped listings replace the single-column time indexes
+        for name in _REPLACED_INDEXES:
+            _drop_index(name)
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        for name, definition in _REPLACED_INDEXES.items():
+            _create_index(name, definition)
+        for name in list(_UNIQUE_INDEXES) + list(_INDEXES):
+            _drop_index(name)
@@ -0,0 +1,84 @@
+"""Store permission roles and recurrence patterns as SMALLINT codes
+
+Revision ID: f1c83a4d6e29
+Revises: d7264b0e5f13
+Create Date: 2026-10-14 09:48:52.390614
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = 'f1c83a4d6e29'
+down_revision = 'd7264b0e5f13'
+branch_labels = None
+depends_on = None
+
+# Mirrors _ROLE_CODES and _RECURRENCE_PATTERN_CODES in app.schemas.event;
+# copied here so later model changes cannot alter what this revision does
+_ENUM_COLUMNS = [
+    ('event_permissions', 'role', 'userrole',
+     {'owner': 0, 'editor': 1, 'viewer': 2}),
+    ('events', 'recurrence_pattern', 'recurrencepattern',
+     {'none': 0, 'daily': 1, 'weekly': 2, 'monthly': 3, 'yearly': 4, 'custom': 5}),
+]
+
+# Databases built by c0e92f5e9721 hold the lowercase values, those built by
+# create_all the uppercase member names. The labels found are kept in a column
+# comment so downgrade can restore the same spelling.
+_LABELS_COMMENT = "Converted from enum {type_name} with labels: {labels}"
+_LABELS_MARKER = " with labels: "
+
+
+def _case(expression, mapping):
+    whens = " ".join(f"WHEN {key!r} THEN {value!r}" for key, value in mapping.items())
+    return f"CASE {expression} {whens} END"
+
+
+def _enum_labels(conn, type_name):
+    """Labels of an existing enum type, in declaration order."""
+    return conn.execute(sa.text(
+        "SELECT enumlabel FROM pg_enum JOIN pg_type ON pg_type.oid = pg_enum.enumtypid "
+        "WHERE pg_type.typname = :name ORDER BY pg_enum.enumsortorder"
+    ), {'name': type_name}).scalars().all()
+
+
+def upgrade():
+    conn = op.get_bind()
+    for table, column, type_name, codes in _ENUM_COLUMNS:
+        labels = _enum_labels(conn, type_name)
+        unknown = [label for label in labels if label.lower() not in codes]
+        if unknown:
+            raise RuntimeError(f"{type_name} has labels with no SMALLINT code: {unknown}")
+        
+        op.execute(
+            f"ALTER TABLE {table} ALTER COLUMN {column} TYPE SMALLINT "
+            f"USING {_case(f'lower({column}::text)', codes)}"
+        )
+        comment = _LABELS_COMMENT.format(type_name=type_name, labels=", ".join(labels))
+        op.execute(f"COMMENT ON COLUMN {table}.{column} IS '{comment}'")
+        op.execute(f"DROP TYPE IF EXISTS {type_name}")
+
+
+def downgrade():
+    conn = op.get_bind()
+    for table, column, type_name, codes in _ENUM_COLUMNS:
+        comment = conn.execute(sa.text(
+            "SELECT col_description(CAST(:table AS regclass), attnum) FROM pg_attribute "
+            "WHERE attrelid = CAST(:table AS regclass) AND attname = :column"
+        ), {'table': table, 'column': column}).scalar()
+        if comment and _LABELS_MARKER in comment:
+            labels = comment.split(_LABELS_MARKER, 1)[1].split(", ")
+        else:
+            # Built at a later revision; use the labels c0e92f5e9721 creates
+            labels = list(codes)
+        
+        postgresql.ENUM(*labels, name=type_name).create(conn, checkfirst=True)
+        names = {codes[label.lower()]: label for label in labels}
+        op.execute(
+            f"ALTER TABLE {table} ALTER COLUMN {column} TYPE {type_name} "
+            f"USING ({_case(column, names)})::{type_name}"
+        )
+        op.execute(f"COMMENT ON COLUMN {table}.{column} IS NULL")
@@ -5,15 +5,16 @@ This module implements the authentication-related API endpoints including
 registration, login, refresh token, and logout functionality.
 """
 
-from datetime import datetime, timedelta
 from typing import Any, Optional
-from fastapi import APIRouter, Depends, HTTPException, status, Header
+from fastapi import APIRouter, Depends, HTTPException, Request, status, Header
 from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
 from jose import JWTError, jwt
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.orm import Session
 
 from app.core.config import settings
-from app.services.auth import AuthenticationService
+from app.services.auth import AuthenticationService, jwt_key
 from app.models.user import UserCreate, User as UserResponse
 from app.schemas.user import User
 from app.db.base import get_db
@@ -22,11 +23,20 @@ router = APIRouter()
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/v1/auth/login")
 
+# Token decoding arguments shared by every authenticated request;
+# python-jose validates "exp" itself and rejects tokens missing either claim;
+# expiry surfaces as ExpiredSignatureError, a JWTError subclass.
+_JWT_ALGORITHMS = (settings.ALGORITHM,)
+_JWT_DECODE_OPTIONS = {"require_exp": True, "require_sub": True}
 
-async def get_current_user(db: Session = Depends(get_db), token: str = Depends(oauth2_scheme)) -> User:
+
+def get_current_user(db: Session = Depends(get_db), token: str = Depends(oauth2_scheme)) -> User:
     """
     Decode JWT token to get current user.
     
+    Declared sync so FastAPI runs the user lookup in its threadpool
+    rather than blocking the event loop.
+    
     Args:
         db: Database session
         token: JWT token
@@ -46,32 +56,27 @@ async def get_current_user(db: Session = Depends(get_db), token: str = Depends(o
     try:
         payload = jwt.decode(
             token, 
-            settings.SECRET_KEY, 
-            algorithms=[settings.ALGORITHM]
+            jwt_key, 
+            algorithms=_JWT_ALGORITHMS,
+            options=_JWT_DECODE_OPTIONS
         )
-        username: str = payload.get("sub")
-        if username is None:
-            raise credentials_exception
-        
-        # Check token expiration
-        expire = payload.get("exp")
-        if expire is None:
-            raise credentials_exception
-        if datetime.utcnow() > datetime.fromtimestamp(expire):
-            raise credentials_exception
-            
     except JWTError:
         raise credentials_exception
-        
-    user = db.query(User).filter(User.username == username).first()
+    
+    username: str = payload["sub"]
+    
+    # Read on every request so deactivation, deletion and credential
+    # changes take effect immediately
+    user = AuthenticationService.get_user_by_username(db, username)
     if user is None:
         raise credentials_exception
-        
+    
     return user
 
 @router.post("/register", response_model=UserResponse, status_code=status.HTTP_201_CREATED)
 def register(
     *,
+    request: Request,
     db: Session = Depends(get_db),
     user_in: UserCreate,
 ) -> User:
@@ -79,6 +84,7 @@ def register(
     Register a new user.
     
     Args:
+        request: Incoming request, used to reach the password hash pool
         db: Database session
         user_in: User creation data
         
@@ -86,27 +92,35 @@ def register(
         User: Created user data
         
     Raises:
-        HTTPException: If user with same email already exists
+        HTTPException: If user with same email or username already exists
     """
-    user = db.query(User).filter(User.email == user_in.email).first()
-    if user:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Email already registered"
-        )
+    hashed_password = request.app.state.hash_pool.submit(
+        AuthenticationService.get_password_hash, user_in.password
+    ).result()
     
-    user = User(
+    # Existence check and insert in one statement; no row comes back when the
+    # email or username is already taken, including by a concurrent registration.
+    stmt = insert(User).values(
         email=user_in.email,
         username=user_in.username,
-        hashed_password=AuthenticationService.get_password_hash(user_in.password)
-    )
-    db.add(user)
+        hashed_password=hashed_password
+    ).on_conflict_do_nothing().returning(*User.__table__.c)
+    user = db.execute(select(User).from_statement(stmt)).scalar_one_or_none()
+    if user is None:
+        # Only the rejected path pays for finding out which one clashed
+        email_taken = db.execute(
+            select(User.id).where(User.email == user_in.email)
+        ).first() is not None
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Email already registered" if email_taken else "Username already registered"
+        )
     db.commit()
-    db.refresh(user)
     return user
 
 @router.post("/login")
 def login(
+    request: Request,
     db: Session = Depends(get_db),
     form_data: OAuth2PasswordRequestForm = Depends()
 ) -> Any:
@@ -114,6 +128,7 @@ def login(
     OAuth2 compatible token login.
     
     Args:
+        request: Incoming request, used to reach the password hash pool
         db: Database session
         form_data: OAuth2 form data
         
@@ -124,7 +139,8 @@ def login(
         HTTPException: If authentication fails
     """
     user = AuthenticationService.authenticate_user(
-        db, form_data.username, form_data.password
+        db, form_data.username, form_data.password,
+        hash_pool=request.app.state.hash_pool
     )
     if not user:
         raise HTTPException(
@@ -133,10 +149,8 @@ def login(
             headers={"WWW-Authenticate": "Bearer"},
         )
     
-    access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
     access_token = AuthenticationService.create_access_token(
-        data={"sub": user.username},
-        expires_delta=access_token_expires
+        data={"sub": user.username}
     )
     
     return {
@@ -159,10 +173,8 @@ def refresh_token(
     Returns:
         dict: New access token and token type
     """
-    access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
     access_token = AuthenticationService.create_access_token(
-        data={"sub": current_user.username},
-        expires_delta=access_token_expires
+        data={"sub": current_user.username}
     )
     
     return {
@@ -7,10 +7,15 @@ collaboration features, and version history.
 
 from typing import List, Optional, Dict, Any
 from datetime import datetime
-from fastapi import APIRouter, Depends, HTTPException, Query, Path, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Path, Request, status
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import ORJSONResponse
+from pydantic import ValidationError
 from sqlalchemy.orm import Session
 
+from app.core.exceptions import BatchConflictError, BatchOperationError, UserNotFoundError
 from app.db.base import get_db
+from app.dto.event import EventCreateDTO
 from app.schemas.user import User
 from app.schemas.event import Event
 from app.models.event import (
@@ -19,8 +24,10 @@ from app.models.event import (
     EventBatchCreate, EventVersionResponse, EventVersionDetailResponse,
     EventChangelogResponse, EventDiffResponse
 )
+from app.models.event_struct import EventDetailStruct, EventStruct, encode_response
+from app.services.batch_event import BatchEventService
 from app.services.event import EventService
-from app.utils.rbac import RoleChecker, get_event_with_permission_check
+from app.utils.rbac import load_event_permissions, require_delete, require_edit, require_manage, require_view
 from app.api.v1.endpoints.auth import get_current_user
 
 router = APIRouter()
@@ -48,8 +55,10 @@ def create_event(
     Raises:
         HTTPException: If there are conflicting events
     """
+    event_data = EventCreateDTO.from_model(event_in)
+    
     # Check for conflicts
-    conflicts = EventService.detect_conflicts(db, event_in, current_user.id)
+    conflicts = EventService.detect_conflicts(db, event_data, current_user.id)
     if conflicts:
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
@@ -57,7 +66,7 @@ def create_event(
         )
     
     # Create the event
-    event = EventService.create_event(db, event_in, current_user)
+    event = EventService.create_event(db, event_data, current_user)
     return event
 
 @router.get("", response_model=List[EventResponse])
@@ -92,30 +101,32 @@ def read_events(
         start_date=start_date,
         end_date=end_date
     )
-    return events
+    return encode_response([EventStruct.from_orm_row(event) for event in events])
 
 @router.get("/{event_id}", response_model=EventDetailResponse)
 def read_event(
     *,
-    event: Event = Depends(get_event_with_permission_check),
+    db: Session = Depends(get_db),
+    event: Event = Depends(require_view),
 ) -> Any:
     """
     Get a specific event by ID.
     
     Args:
+        db: Database session
         event: Event (from dependency with permission check)
         
     Returns:
         EventDetailResponse: Event details
     """
-    return event
+    load_event_permissions(db, event)
+    return encode_response(EventDetailStruct.from_orm_row(event))
 
 @router.put("/{event_id}", response_model=EventResponse)
 def update_event(
     *,
     db: Session = Depends(get_db),
-    event: Event = Depends(lambda event_id, db=Depends(get_db), current_user=Depends(get_current_user): 
-                            get_event_with_permission_check(event_id, current_user, "edit", db)),
+    event: Event = Depends(require_edit),
     event_in: EventUpdate,
     current_user: User = Depends(get_current_user)
 ) -> Any:
@@ -137,8 +148,8 @@ def update_event(
     # If start or end time changed, check for conflicts
     if (event_in.start_time is not None and event_in.start_time != event.start_time) or \
        (event_in.end_time is not None and event_in.end_time != event.end_time):
-        # Create EventCreate instance for conflict detection
-        conflict_check = EventCreate(
+        # Merge the update over the stored event for conflict detection
+        conflict_check = EventCreateDTO(
             title=event_in.title if event_in.title is not None else event.title,
             description=event_in.description if event_in.description is not None else event.description,
             start_time=event_in.start_time if event_in.start_time is not None else event.start_time,
@@ -148,6 +159,11 @@ def update_event(
             recurrence_pattern=event_in.recurrence_pattern if event_in.recurrence_pattern is not None else event.recurrence_pattern,
             recurrence_rule=event_in.recurrence_rule if event_in.recurrence_rule is not None else event.recurrence_rule
         )
+        if conflict_check.end_time <= conflict_check.start_time:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="end_time must be after start_time"
+            )
         
         conflicts = EventService.detect_conflicts(db, conflict_check, current_user.id, event.id)
         if conflicts:
@@ -160,12 +176,11 @@ def update_event(
     updated_event = EventService.update_event(db, event, event_in, current_user)
     return updated_event
 
-@router.delete("/{event_id}", status_code=status.HTTP_204_NO_CONTENT)
+@router.delete("/{event_id}", status_code=status.HTTP_204_NO_CONTENT, response_model=None)
 def delete_event(
     *,
     db: Session = Depends(get_db),
-    event: Event = Depends(lambda event_id, db=Depends(get_db), current_user=Depends(get_current_user): 
-                            get_event_with_permission_check(event_id, current_user, "delete", db)),
+    event: Event = Depends(require_delete),
 ) -> Any:
     """
     Delete an event.
@@ -180,11 +195,35 @@ def delete_event(
     EventService.delete_event(db, event)
     return None
 
-@router.post("/batch", response_model=List[EventResponse], status_code=status.HTTP_201_CREATED)
+async def batch_request_body(request: Request) -> EventBatchCreate:
+    """Dependency validating the raw batch body straight from JSON."""
+    try:
+        return BatchEventService.parse_batch_request(await request.body())
+    except ValidationError as e:
+        raise RequestValidationError(
+            [{**error, "loc": ("body", *error["loc"])} for error in e.errors(include_url=False)]
+        )
+
+# The body is read by batch_request_body, so describe it for OpenAPI here.
+# Nested models resolve to the component schemas FastAPI already emits.
+_BATCH_BODY_SCHEMA = EventBatchCreate.model_json_schema(ref_template="#/components/schemas/{model}")
+_BATCH_BODY_SCHEMA.pop("$defs", None)
+
+@router.post(
+    "/batch",
+    response_model=List[EventResponse],
+    status_code=status.HTTP_201_CREATED,
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": _BATCH_BODY_SCHEMA}},
+        }
+    },
+)
 def batch_create_events(
     *,
     db: Session = Depends(get_db),
-    events_in: EventBatchCreate,
+    events_in: EventBatchCreate = Depends(batch_request_body),
     current_user: User = Depends(get_current_user)
 ) -> Any:
     """
@@ -198,25 +237,21 @@ def batch_create_events(
     Returns:
         List[EventResponse]: List of created events
     """
-    # Check for conflicts in all events
-    conflicts = []
-    for event_in in events_in.events:
-        event_conflicts = EventService.detect_conflicts(db, event_in, current_user.id)
-        if event_conflicts:
-            conflicts.append({
-                "event": event_in,
-                "conflicts": len(event_conflicts)
-            })
-    
-    if conflicts:
-        raise HTTPException(
-            status_code=status.HTTP_409_CONFLICT,
-            detail=f"{len(conflicts)} events have conflicts"
-        )
-    
-    # Create all events
-    events = EventService.batch_create_events(db, events_in.events, current_user)
-    return events
+    error = BatchEventService.validate_batch_request(events_in.events)
+    if error:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=error)
+
+    try:
+        events = BatchEventService.create_batch_events(db, events_in.events, current_user)
+    except BatchConflictError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
+    except BatchOperationError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    return encode_response(
+        [EventStruct.from_orm_row(event) for event in events],
+        status_code=status.HTTP_201_CREATED
+    )
 
 # ================== Collaboration Endpoints ==================
 
@@ -224,8 +259,7 @@ def batch_create_events(
 def share_event(
     *,
     db: Session = Depends(get_db),
-    event: Event = Depends(lambda event_id, db=Depends(get_db), current_user=Depends(get_current_user): 
-                            get_event_with_permission_check(event_id, current_user, "manage", db)),
+    event: Event = Depends(require_manage),
     permission_in: EventPermissionCreate,
     current_user: User = Depends(get_current_user)
 ) -> Any:
@@ -244,23 +278,19 @@ def share_event(
     Raises:
         HTTPException: If user not found
     """
-    # Check if user exists
-    user = db.query(User).filter(User.id == permission_in.user_id).first()
-    if not user:
+    try:
+        permission = EventService.share_event(db, event, permission_in.user_id, permission_in.role)
+    except UserNotFoundError:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="User not found"
         )
-    
-    # Share the event
-    permission = EventService.share_event(db, event, permission_in.user_id, permission_in.role)
     return permission
 
 @router.get("/{event_id}/permissions", response_model=List[EventPermissionResponse])
 def get_event_permissions(
     *,
-    event: Event = Depends(lambda event_id, db=Depends(get_db), current_user=Depends(get_current_user): 
-                            get_event_with_permission_check(event_id, current_user, "manage", db)),
+    event: Event = Depends(require_manage),
     db: Session = Depends(get_db)
 ) -> Any:
     """
@@ -279,8 +309,7 @@ def get_event_permissions(
 @router.put("/{event_id}/permissions/{user_id}", response_model=EventPermissionResponse)
 def update_event_permission(
     *,
-    event: Event = Depends(lambda event_id, db=Depends(get_db), current_user=Depends(get_current_user): 
-                            get_event_with_permission_check(event_id, current_user, "manage", db)),
+    event: Event = Depends(require_manage),
     user_id: int = Path(..., title="The ID of the user to update permissions for"),
     permission_in: EventPermissionUpdate,
     db: Session = Depends(get_db)
@@ -308,11 +337,10 @@ def update_event_permission(
         )
     return permission
 
-@router.delete("/{event_id}/permissions/{user_id}", status_code=status.HTTP_204_NO_CONTENT)
+@router.delete("/{event_id}/permissions/{user_id}", status_code=status.HTTP_204_NO_CONTENT, response_model=None)
 def delete_event_permission(
     *,
-    event: Event = Depends(lambda event_id, db=Depends(get_db), current_user=Depends(get_current_user): 
-                            get_event_with_permission_check(event_id, current_user, "manage", db)),
+    event: Event = Depends(require_manage),
     user_id: int = Path(..., title="The ID of the user to remove permissions for"),
     db: Session = Depends(get_db)
 ) -> Any:
@@ -343,8 +371,7 @@ def delete_event_permission(
 @router.get("/{event_id}/history/{version_id}", response_model=EventVersionDetailResponse)
 def get_event_version(
     *,
-    event: Event = Depends(lambda event_id, db=Depends(get_db), current_user=Depends(get_current_user): 
-                            get_event_with_permission_check(event_id, current_user, "view", db)),
+    event: Event = Depends(require_view),
     version_id: int = Path(..., title="The version number to retrieve"),
     db: Session = Depends(get_db)
 ) -> Any:
@@ -373,8 +400,7 @@ def get_event_version(
 @router.post("/{event_id}/rollback/{version_id}", response_model=EventResponse)
 def rollback_event(
     *,
-    event: Event = Depends(lambda event_id, db=Depends(get_db), current_user=Depends(get_current_user): 
-                            get_event_with_permission_check(event_id, current_user, "edit", db)),
+    event: Event = Depends(require_edit),
     version_id: int = Path(..., title="The version number to rollback to"),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
@@ -405,8 +431,7 @@ def rollback_event(
 @router.get("/{event_id}/changelog", response_model=List[EventVersionResponse])
 def get_event_changelog(
     *,
-    event: Event = Depends(lambda event_id, db=Depends(get_db), current_user=Depends(get_current_user): 
-                            get_event_with_permission_check(event_id, current_user, "view", db)),
+    event: Event = Depends(require_view),
     db: Session = Depends(get_db)
 ) -> Any:
     """
@@ -425,8 +450,7 @@ def get_event_changelog(
 @router.get("/{event_id}/diff/{version_id1}/{version_id2}", response_model=EventDiffResponse)
 def get_event_diff(
     *,
-    event: Event = Depends(lambda event_id, db=Depends(get_db), current_user=Depends(get_current_user): 
-                            get_event_with_permission_check(event_id, current_user, "view", db)),
+    event: Event = Depends(require_view),
     version_id1: int = Path(..., title="First version number for comparison"),
     version_id2: int = Path(..., title="Second version number for comparison"),
     db: Session = Depends(get_db)
@@ -447,14 +471,16 @@ def get_event_diff(
         HTTPException: If versions not found
     """
     diff = EventService.calculate_diff(db, event.id, version_id1, version_id2)
-    if not diff:
+    if diff is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="One or both versions not found"
         )
     
-    return {
+    # The diff holds only JSON-native snapshot values, so skip response
+    # model validation and encode it directly
+    return ORJSONResponse(content={
         "version1": version_id1,
         "version2": version_id2,
         "diff": diff
-    }
+    })
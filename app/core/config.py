@@ -5,8 +5,11 @@ This module handles loading and validating configuration from environment variab
 using Pydantic's BaseSettings model.
 """
 
-from typing import Any, Dict, Optional, List, Union
-from pydantic import BaseSettings, PostgresDsn, validator
+from functools import lru_cache
+from typing import Any, Dict, Optional, List, Tuple, Union
+from typing_extensions import Annotated
+from pydantic import PostgresDsn, field_validator
+from pydantic_settings import BaseSettings, NoDecode, SettingsConfigDict
 
 
 class Settings(BaseSettings):
@@ -18,8 +21,22 @@ class Settings(BaseSettings):
     PROJECT_NAME: str = "Event Management System"
     VERSION: str = "1.0.0"
     
+    # Worker threads for sync endpoints and dependencies
+    THREADPOOL_MAX_WORKERS: int = 40
+    # Processes for password hashing; defaults to the CPU count
+    PASSWORD_HASH_WORKERS: Optional[int] = None
+    # Fill the connection pool and start hash workers before serving requests
+    WARM_UP_ON_STARTUP: bool = True
+    
     # Database Configuration
     DATABASE_URL: PostgresDsn
+    # Disable where Alembic manages the schema to skip create_all at startup
+    CREATE_TABLES_ON_STARTUP: bool = True
+    # Connection pool
+    DB_PRE_PING: bool = False
+    DB_POOL_RECYCLE_SECONDS: int = 1800
+    DB_POOL_SIZE: int = 20
+    DB_MAX_OVERFLOW: int = 10
     
     # JWT Configuration
     SECRET_KEY: str
@@ -27,20 +44,34 @@ class Settings(BaseSettings):
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
     
     # CORS Configuration
-    BACKEND_CORS_ORIGINS: List[str] = ["*"]
+    BACKEND_CORS_ORIGINS: Annotated[Tuple[str, ...], NoDecode] = ("*",)
     
-    @validator("BACKEND_CORS_ORIGINS", pre=True)
-    def assemble_cors_origins(cls, v: Union[str, List[str]]) -> List[str]:
+    @field_validator("BACKEND_CORS_ORIGINS", mode="before")
+    @classmethod
+    def assemble_cors_origins(cls, v: Union[str, List[str]]) -> Tuple[str, ...]:
         """Validate and process CORS origins configuration."""
         if isinstance(v, str):
-            return [i.strip() for i in v.split(",")]
-        return v
+            return tuple(i.strip() for i in v.split(","))
+        return tuple(v)
+
+    model_config = SettingsConfigDict(
+        case_sensitive=True,
+        env_file=".env",
+        extra="ignore",
+        frozen=True,
+    )
 
-    class Config:
-        """Pydantic configuration class."""
-        case_sensitive = True
-        env_file = ".env"
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """
+    Load the application settings once per process.
+    
+    Returns:
+        Settings: Parsed and validated settings
+    """
+    return Settings()
 
 
-# Create global settings instance
-settings = Settings()
+# Global settings instance
+settings = get_settings()
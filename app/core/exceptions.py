@@ -0,0 +1,23 @@
+"""
+Domain exceptions for the application.
+
+Services raise these exceptions and the API layer converts them to HTTP errors.
+"""
+
+
+class UserNotFoundError(Exception):
+    """Raised when an operation references a user that does not exist."""
+
+
+class BatchOperationError(Exception):
+    """Raised when a batch request is invalid or cannot be applied."""
+
+
+class BatchConflictError(BatchOperationError):
+    """Raised when events in a batch overlap existing events or each other."""
+
+    def __init__(self, conflicts, batch_overlaps=None):
+        self.conflicts = conflicts
+        self.batch_overlaps = batch_overlaps or {}
+        affected = set(conflicts) | set(self.batch_overlaps)
+        super().__init__(f"{len(affected)} events have conflicts")
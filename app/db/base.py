@@ -4,21 +4,46 @@ Database configuration module.
 This module sets up the SQLAlchemy engine and session management.
 """
 
-from typing import Generator
-from sqlalchemy import create_engine
+from contextvars import ContextVar
+from typing import Any, Generator, List, Optional
+import orjson
+from sqlalchemy import create_engine, event, text
 from sqlalchemy.orm import sessionmaker, Session
 
 from app.core.config import settings
 from app.schemas.base import Base
 
+def _json_serializer(value: Any) -> str:
+    """Encode JSON/JSONB column values with orjson."""
+    return orjson.dumps(value).decode()
+
 # Create SQLAlchemy engine
 engine = create_engine(
     str(settings.DATABASE_URL),
-    pool_pre_ping=True,  # Enable connection pool "pre-ping" feature
+    pool_pre_ping=settings.DB_PRE_PING,  # Ping on checkout; costs a round trip each time
+    pool_recycle=settings.DB_POOL_RECYCLE_SECONDS,  # Replace connections before server idle timeouts
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    json_serializer=_json_serializer,
+    json_deserializer=orjson.loads,
 )
 
-# Create SessionLocal class for database sessions
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# Per-request statement counter, set by the DEBUG query-count middleware so
+# N+1 regressions show up as a growing X-Query-Count header.
+statement_count: ContextVar[Optional[List[int]]] = ContextVar("statement_count", default=None)
+
+if settings.DEBUG:
+    @event.listens_for(engine, "before_cursor_execute")
+    def _count_statement(conn, cursor, statement, parameters, context, executemany):
+        """Count a statement against the current request, if one is being counted."""
+        counter = statement_count.get()
+        if counter is not None:
+            counter[0] += 1
+
+# Create SessionLocal class for database sessions. Sessions live for one
+# request, so objects are not expired on commit; reading them afterwards
+# (e.g. to build the response) doesn't trigger a reload SELECT.
+SessionLocal = sessionmaker(autocommit=False, autoflush=False, expire_on_commit=False, bind=engine)
 
 def get_db() -> Generator[Session, None, None]:
     """
@@ -32,3 +57,18 @@ def get_db() -> Generator[Session, None, None]:
         yield db
     finally:
         db.close()
+
+def warm_pool(size: int) -> None:
+    """
+    Open pooled connections ahead of traffic.
+    
+    Args:
+        size: Number of connections to open and return to the pool
+    """
+    connections = [engine.connect() for _ in range(size)]
+    try:
+        for connection in connections:
+            connection.execute(text("SELECT 1"))
+    finally:
+        for connection in connections:
+            connection.close()
@@ -0,0 +1,31 @@
+"""
+Internal data transfer objects for events.
+
+Pydantic models validate data at the HTTP boundary; once validated, event data
+is handed between services as these slotted dataclasses instead, so it is not
+re-validated on every hop.
+"""
+
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+from app.models.event import EventCreate
+from app.schemas.event import RecurrencePattern
+
+@dataclass(slots=True, frozen=True)
+class EventCreateDTO:
+    """Validated data for a new event."""
+    title: str
+    start_time: datetime
+    end_time: datetime
+    description: Optional[str] = None
+    location: Optional[str] = None
+    is_recurring: bool = False
+    recurrence_pattern: Optional[RecurrencePattern] = RecurrencePattern.NONE
+    recurrence_rule: Optional[Dict[str, Any]] = None
+
+    @classmethod
+    def from_model(cls, event_in: EventCreate) -> "EventCreateDTO":
+        """Build from a validated EventCreate model."""
+        return cls(**event_in.model_dump())
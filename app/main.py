@@ -4,15 +4,61 @@ Main application module.
 This module initializes the FastAPI application and includes all routes.
 """
 
-from fastapi import FastAPI
+import asyncio
+import os
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import asynccontextmanager
+
+import anyio
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
 from app.core.config import settings
 from app.api.v1.endpoints import auth, events
+from app.db.base import statement_count, warm_pool
+from app.services.auth import AuthenticationService
 
 # Import models module to ensure all models are registered
 from app.db import models
 
+async def _warm_hash_pool(hash_pool: ProcessPoolExecutor, workers: int) -> None:
+    """Start every hash worker and load the hashing backend in each."""
+    loop = asyncio.get_running_loop()
+    await asyncio.gather(*(
+        loop.run_in_executor(hash_pool, AuthenticationService.get_password_hash, "warmup")
+        for _ in range(workers)
+    ))
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Initialize application resources on startup and release them on shutdown."""
+    # Sync endpoints and dependencies run in anyio's worker threads; size the
+    # pool explicitly instead of relying on the default limiter.
+    anyio.to_thread.current_default_thread_limiter().total_tokens = settings.THREADPOOL_MAX_WORKERS
+    # Password hashing is CPU-bound; hash and verify passwords in worker
+    # processes so they run in parallel across cores instead of contending
+    # for the GIL.
+    hash_workers = settings.PASSWORD_HASH_WORKERS or os.cpu_count() or 1
+    app.state.hash_pool = ProcessPoolExecutor(max_workers=hash_workers)
+    startup = []
+    # Tables must exist before the first request is served, so start-up
+    # waits for them and a failure here stops the server from starting.
+    if settings.CREATE_TABLES_ON_STARTUP:
+        startup.append(asyncio.to_thread(models.create_all))
+    # Pay connection setup and worker process start-up now rather than on
+    # the first requests; this overlaps with table creation.
+    if settings.WARM_UP_ON_STARTUP:
+        startup.append(asyncio.to_thread(warm_pool, settings.DB_POOL_SIZE))
+        startup.append(_warm_hash_pool(app.state.hash_pool, hash_workers))
+    try:
+        await asyncio.gather(*startup)
+        yield
+    finally:
+        app.state.hash_pool.shutdown()
+
+
 # Initialize FastAPI app
 app = FastAPI(
     title=settings.PROJECT_NAME,
@@ -20,6 +66,8 @@ app = FastAPI(
     openapi_url=f"{settings.API_V1_PREFIX}/openapi.json",
     docs_url="/docs",
     redoc_url="/redoc",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
 )
 
 # Set up CORS middleware
@@ -31,6 +79,20 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# In debug mode, report how many SQL statements each request ran
+if settings.DEBUG:
+    @app.middleware("http")
+    async def count_queries(request: Request, call_next):
+        """Add an X-Query-Count header with the request's statement count."""
+        counter = [0]
+        token = statement_count.set(counter)
+        try:
+            response = await call_next(request)
+        finally:
+            statement_count.reset(token)
+        response.headers["X-Query-Count"] = str(counter[0])
+        return response
+
 # Include routers
 app.include_router(
     auth.router,
@@ -48,10 +110,3 @@ app.include_router(
 def health_check():
     """Health check endpoint."""
     return {"status": "healthy"}
-
-
-# Create all database tables on application startup
-@app.on_event("startup")
-def startup_event():
-    """Initialize application on startup."""
-    models.create_all()
@@ -4,15 +4,22 @@ Pydantic models for event-related requests and responses.
 This module defines the data validation and serialization models for the API.
 """
 
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Optional, List, Dict, Any, Union
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, ConfigDict, Field, SkipValidation, TypeAdapter, ValidationInfo, field_validator
+from typing_extensions import TypedDict
 
 from app.schemas.event import RecurrencePattern
 from app.schemas.user import UserRole
 
 # ==================== Request Models ====================
 
+def _assume_utc(value: Optional[datetime]) -> Optional[datetime]:
+    """Treat naive datetimes as UTC so they compare with timezone-aware ones."""
+    if value is not None and value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value
+
 class EventPermissionCreate(BaseModel):
     """Model for creating event permissions."""
     user_id: int
@@ -33,23 +40,33 @@ class EventBase(BaseModel):
     recurrence_pattern: Optional[RecurrencePattern] = RecurrencePattern.NONE
     recurrence_rule: Optional[Dict[str, Any]] = None
     
-    @validator('end_time')
-    def end_time_must_be_after_start_time(cls, v, values):
+    @field_validator('start_time', 'end_time')
+    @classmethod
+    def times_are_aware(cls, v):
+        """Normalize naive times to UTC before they are compared."""
+        return _assume_utc(v)
+    
+    @field_validator('end_time')
+    @classmethod
+    def end_time_must_be_after_start_time(cls, v, info: ValidationInfo):
         """Validate that end_time is after start_time."""
+        values = info.data
         if 'start_time' in values and v <= values['start_time']:
             raise ValueError('end_time must be after start_time')
         return v
     
-    @validator('recurrence_rule')
-    def validate_recurrence_rule(cls, v, values):
+    @field_validator('recurrence_rule')
+    @classmethod
+    def validate_recurrence_rule(cls, v, info: ValidationInfo):
         """
         Validate that recurrence_rule is provided if recurrence_pattern is CUSTOM.
         And not provided if recurrence_pattern is not CUSTOM.
         """
-        recurrence_pattern = values.get('recurrence_pattern')
-        if recurrence_pattern == RecurrencePattern.CUSTOM and not v:
+        # Validated enum fields hold members, so identity is enough
+        is_custom = info.data.get('recurrence_pattern') is RecurrencePattern.CUSTOM
+        if is_custom and not v:
             raise ValueError('recurrence_rule must be provided when recurrence_pattern is CUSTOM')
-        if recurrence_pattern != RecurrencePattern.CUSTOM and v:
+        if not is_custom and v:
             raise ValueError('recurrence_rule should only be provided when recurrence_pattern is CUSTOM')
         return v
 
@@ -68,9 +85,17 @@ class EventUpdate(BaseModel):
     recurrence_pattern: Optional[RecurrencePattern] = None
     recurrence_rule: Optional[Dict[str, Any]] = None
     
-    @validator('end_time')
-    def end_time_must_be_after_start_time(cls, v, values):
+    @field_validator('start_time', 'end_time')
+    @classmethod
+    def times_are_aware(cls, v):
+        """Normalize naive times to UTC before they are compared."""
+        return _assume_utc(v)
+    
+    @field_validator('end_time')
+    @classmethod
+    def end_time_must_be_after_start_time(cls, v, info: ValidationInfo):
         """Validate that end_time is after start_time if both are provided."""
+        values = info.data
         if v and 'start_time' in values and values['start_time'] and v <= values['start_time']:
             raise ValueError('end_time must be after start_time')
         return v
@@ -89,9 +114,7 @@ class EventPermissionResponse(BaseModel):
     created_at: datetime
     updated_at: Optional[datetime] = None
     
-    class Config:
-        """Configure ORM compatibility."""
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
 
 class EventVersionResponse(BaseModel):
     """Model for event version responses."""
@@ -101,9 +124,7 @@ class EventVersionResponse(BaseModel):
     created_at: datetime
     change_description: Optional[str] = None
     
-    class Config:
-        """Configure ORM compatibility."""
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
 
 class EventResponse(EventBase):
     """Model for event responses."""
@@ -113,45 +134,54 @@ class EventResponse(EventBase):
     updated_at: Optional[datetime] = None
     version: int
     
-    class Config:
-        """Configure ORM compatibility."""
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
 
 class EventDetailResponse(EventResponse):
     """Model for detailed event responses including permissions."""
     permissions: List[EventPermissionResponse] = []
     
-    class Config:
-        """Configure ORM compatibility."""
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
 
 class EventVersionDetailResponse(BaseModel):
     """Model for detailed event version responses."""
     id: int
     version: int
-    data: Dict[str, Any]  # Full event data at that version
+    # Full event data at that version; JSONB from our own snapshots, so not re-validated
+    data: SkipValidation[Dict[str, Any]]
     changed_by_id: int
     created_at: datetime
     change_description: Optional[str] = None
     
-    class Config:
-        """Configure ORM compatibility."""
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
 
 class EventChangelogResponse(BaseModel):
     """Model for event changelog responses."""
     versions: List[EventVersionResponse]
     
-    class Config:
-        """Configure ORM compatibility."""
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
 
 class EventDiffResponse(BaseModel):
     """Model for diff between two event versions."""
     version1: int
     version2: int
-    diff: Dict[str, Any]  # Field-by-field differences
+    # Field-by-field differences, computed from snapshots; not re-validated
+    diff: SkipValidation[Dict[str, Any]]
     
-    class Config:
-        """Configure ORM compatibility."""
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
+
+# ==================== Stored Snapshots ====================
+
+class EventSnapshot(TypedDict, total=False):
+    """Restorable fields of an event version snapshot."""
+    title: str
+    description: Optional[str]
+    start_time: Optional[datetime]
+    end_time: Optional[datetime]
+    location: Optional[str]
+    is_recurring: bool
+    recurrence_pattern: Optional[RecurrencePattern]
+    recurrence_rule: Optional[Dict[str, Any]]
+
+# Built once; validates a stored snapshot into a plain dict of the fields it
+# contains, with ISO strings and enum values converted by pydantic-core.
+event_snapshot_adapter = TypeAdapter(EventSnapshot)
@@ -0,0 +1,102 @@
+"""
+msgspec structs for encoding event responses.
+
+These mirror the Pydantic response models in app.models.event field for field.
+They are used only to encode ORM rows on the hot read paths; the Pydantic
+models stay the source of truth for validation and the OpenAPI schema.
+"""
+
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+import msgspec
+from fastapi import Response, status
+
+from app.schemas.event import Event, EventPermission, RecurrencePattern
+from app.schemas.user import UserRole
+
+_encoder = msgspec.json.Encoder()
+
+class EventPermissionStruct(msgspec.Struct, frozen=True, kw_only=True):
+    """Encoded form of EventPermissionResponse."""
+    id: int
+    user_id: int
+    role: UserRole
+    created_at: datetime
+    updated_at: Optional[datetime] = None
+
+    @classmethod
+    def from_orm_row(cls, permission: EventPermission) -> "EventPermissionStruct":
+        """Build from an EventPermission row by reading its attributes directly."""
+        return cls(
+            id=permission.id,
+            user_id=permission.user_id,
+            role=permission.role,
+            created_at=permission.created_at,
+            updated_at=permission.updated_at,
+        )
+
+class EventStruct(msgspec.Struct, frozen=True, kw_only=True):
+    """Encoded form of EventResponse."""
+    title: str
+    description: Optional[str] = None
+    start_time: datetime
+    end_time: datetime
+    location: Optional[str] = None
+    is_recurring: bool = False
+    recurrence_pattern: Optional[RecurrencePattern] = RecurrencePattern.NONE
+    recurrence_rule: Optional[Dict[str, Any]] = None
+    id: int
+    owner_id: int
+    created_at: datetime
+    updated_at: Optional[datetime] = None
+    version: int
+
+    @classmethod
+    def _fields_from_orm_row(cls, event: Event) -> Dict[str, Any]:
+        """Read the EventResponse fields off an Event row."""
+        return dict(
+            title=event.title,
+            description=event.description,
+            start_time=event.start_time,
+            end_time=event.end_time,
+            location=event.location,
+            is_recurring=event.is_recurring,
+            recurrence_pattern=event.recurrence_pattern,
+            recurrence_rule=event.recurrence_rule,
+            id=event.id,
+            owner_id=event.owner_id,
+            created_at=event.created_at,
+            updated_at=event.updated_at,
+            version=event.version,
+        )
+
+    @classmethod
+    def from_orm_row(cls, event: Event) -> "EventStruct":
+        """Build from an Event row by reading its attributes directly."""
+        return cls(**cls._fields_from_orm_row(event))
+
+class EventDetailStruct(EventStruct, frozen=True, kw_only=True):
+    """Encoded form of EventDetailResponse."""
+    permissions: List[EventPermissionStruct] = []
+
+    @classmethod
+    def from_orm_row(cls, event: Event) -> "EventDetailStruct":
+        """Build from an Event row, including its permissions."""
+        return cls(
+            **cls._fields_from_orm_row(event),
+            permissions=[EventPermissionStruct.from_orm_row(p) for p in event.permissions],
+        )
+
+def encode_response(content: Any, status_code: int = status.HTTP_200_OK) -> Response:
+    """
+    Encode structs into a JSON response, bypassing FastAPI's response model.
+
+    Args:
+        content: Struct or list of structs to encode
+        status_code: HTTP status code of the response
+
+    Returns:
+        Response: Encoded JSON response
+    """
+    return Response(_encoder.encode(content), status_code=status_code, media_type="application/json")
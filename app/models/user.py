@@ -5,7 +5,7 @@ This module defines the data validation and serialization models for the API.
 """
 
 from typing import Optional
-from pydantic import BaseModel, EmailStr, constr
+from pydantic import BaseModel, ConfigDict, EmailStr, constr
 
 class UserBase(BaseModel):
     """Base user model with common attributes."""
@@ -19,14 +19,13 @@ class UserCreate(UserBase):
 
 class UserUpdate(UserBase):
     """Model for user update requests."""
-    password: Optional[constr(min_length=8)]
+    password: Optional[constr(min_length=8)] = None
 
 class UserInDBBase(UserBase):
     """Base model for users in database."""
     id: int
 
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
 
 class User(UserInDBBase):
     """Model for user responses."""
@@ -4,24 +4,32 @@ Event-related SQLAlchemy models.
 This module defines the database models for event management, permissions, and versioning.
 """
 
-from sqlalchemy import Boolean, Column, DateTime, Enum, ForeignKey, Integer, String, JSON, Text, UniqueConstraint
+from sqlalchemy import DDL, BigInteger, Boolean, Column, DateTime, ForeignKey, Identity, Index, Integer, String, Text, UniqueConstraint
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy import event as sa_event
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 import enum
 from datetime import datetime
+from functools import cached_property
+from typing import Dict
 
 from app.schemas.base import Base
+from app.schemas.types import IntEnumType
 from app.schemas.user import UserRole
 
+# On-disk codes for the enum columns; never renumber existing members
+_ROLE_CODES = {UserRole.OWNER: 0, UserRole.EDITOR: 1, UserRole.VIEWER: 2}
+
 class EventPermission(Base):
     """Model for event permissions linking users to events with specific roles."""
     
     __tablename__ = "event_permissions"
     
-    id = Column(Integer, primary_key=True, index=True)
-    event_id = Column(Integer, ForeignKey("events.id", ondelete="CASCADE"), nullable=False)
+    id = Column(BigInteger, Identity(cache=1000), primary_key=True, index=True)
+    event_id = Column(BigInteger, ForeignKey("events.id", ondelete="CASCADE"), nullable=False, index=True)
     user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
-    role = Column(Enum(UserRole), nullable=False)
+    role = Column(IntEnumType(UserRole, _ROLE_CODES), nullable=False)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
     
@@ -32,6 +40,15 @@ class EventPermission(Base):
     class Config:
         """SQLAlchemy ORM config."""
         orm_mode = True
+    
+    # Fetch server-generated columns with RETURNING instead of a later SELECT
+    __mapper_args__ = {"eager_defaults": True}
+    
+    __table_args__ = (
+        # One permission per user and event; also probed by listings and
+        # permission checks, and the conflict target of the sharing upsert
+        Index('ix_event_permissions_user_event', user_id, event_id, unique=True),
+    )
 
 class RecurrencePattern(enum.Enum):
     """Enumeration of possible recurrence patterns for events."""
@@ -42,22 +59,31 @@ class RecurrencePattern(enum.Enum):
     YEARLY = "yearly"
     CUSTOM = "custom"  # For more complex patterns defined in recurrence_rule
 
+_RECURRENCE_PATTERN_CODES = {
+    RecurrencePattern.NONE: 0,
+    RecurrencePattern.DAILY: 1,
+    RecurrencePattern.WEEKLY: 2,
+    RecurrencePattern.MONTHLY: 3,
+    RecurrencePattern.YEARLY: 4,
+    RecurrencePattern.CUSTOM: 5,
+}
+
 class Event(Base):
     """Model for events with versioning and permissions support."""
     
     __tablename__ = "events"
     
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(BigInteger, Identity(cache=1000), primary_key=True, index=True)
     title = Column(String, index=True, nullable=False)
     description = Column(Text, nullable=True)
-    start_time = Column(DateTime(timezone=True), nullable=False, index=True)
-    end_time = Column(DateTime(timezone=True), nullable=False, index=True)
+    start_time = Column(DateTime(timezone=True), nullable=False)
+    end_time = Column(DateTime(timezone=True), nullable=False)
     location = Column(String, nullable=True)
     
     # Recurrence fields
     is_recurring = Column(Boolean, default=False, nullable=False)
-    recurrence_pattern = Column(Enum(RecurrencePattern), default=RecurrencePattern.NONE)
-    recurrence_rule = Column(JSON, nullable=True)  # Advanced recurrence rules (RFC 5545)
+    recurrence_pattern = Column(IntEnumType(RecurrencePattern, _RECURRENCE_PATTERN_CODES), default=RecurrencePattern.NONE)
+    recurrence_rule = Column(JSONB, nullable=True)  # Advanced recurrence rules (RFC 5545)
     
     # Ownership and tracking
     owner_id = Column(Integer, ForeignKey("users.id"), nullable=False)
@@ -67,22 +93,42 @@ class Event(Base):
     
     # Relationships
     owner = relationship("User", back_populates="events")
-    permissions = relationship("EventPermission", back_populates="event", cascade="all, delete-orphan")
-    versions = relationship("EventVersion", back_populates="event", cascade="all, delete-orphan")
+    # The foreign keys cascade on delete, so unloaded children are left to the database
+    permissions = relationship("EventPermission", back_populates="event", cascade="all, delete-orphan",
+                               passive_deletes=True)
+    versions = relationship("EventVersion", back_populates="event", cascade="all, delete-orphan",
+                            passive_deletes=True)
+    
+    @cached_property
+    def role_by_user_id(self) -> Dict[int, UserRole]:
+        """Permission roles keyed by user ID, built once per loaded instance."""
+        return {permission.user_id: permission.role for permission in self.permissions}
     
     class Config:
         """SQLAlchemy ORM config."""
         orm_mode = True
+    
+    # Fetch server-generated columns with RETURNING instead of a later SELECT
+    __mapper_args__ = {"eager_defaults": True}
+    
+    __table_args__ = (
+        # Owner-scoped listings ordered or windowed by start time; covers
+        # end_time and title so calendar views can use index-only scans
+        Index('ix_events_owner_time', owner_id, start_time,
+              postgresql_include=['end_time', 'title']),
+        # Answers time-range overlap (&&) queries used by conflict detection
+        Index('ix_events_time_range', func.tstzrange(start_time, end_time), postgresql_using='gist'),
+    )
 
 class EventVersion(Base):
     """Model for storing event version history."""
     
     __tablename__ = "event_versions"
     
-    id = Column(Integer, primary_key=True, index=True)
-    event_id = Column(Integer, ForeignKey("events.id", ondelete="CASCADE"), nullable=False)
+    id = Column(BigInteger, Identity(cache=1000), primary_key=True, index=True)
+    event_id = Column(BigInteger, ForeignKey("events.id", ondelete="CASCADE"), nullable=False)
     version = Column(Integer, nullable=False)  # Version number
-    data = Column(JSON, nullable=False)  # Full event data snapshot
+    data = Column(JSONB, nullable=False)  # Full event data snapshot
     changed_by_id = Column(Integer, ForeignKey("users.id"), nullable=False)
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     change_description = Column(Text, nullable=True)  # Optional description of changes
@@ -94,8 +140,23 @@ class EventVersion(Base):
     class Config:
         """SQLAlchemy ORM config."""
         orm_mode = True
+    
+    # Fetch server-generated columns with RETURNING instead of a later SELECT
+    __mapper_args__ = {"eager_defaults": True}
         
     __table_args__ = (
         # Ensure each version number is unique per event
         UniqueConstraint('event_id', 'version', name='uix_event_version'),
     )
+
+# Large snapshots are TOASTed; compress them with lz4, which decompresses much
+# faster than the default pglz, when the server was built with it.
+_EVENT_VERSIONS_LZ4_DDL = """
+DO $$ BEGIN
+    IF EXISTS (SELECT 1 FROM pg_settings
+               WHERE name = 'default_toast_compression' AND 'lz4' = ANY(enumvals)) THEN
+        ALTER TABLE event_versions ALTER COLUMN data SET COMPRESSION lz4;
+    END IF;
+END $$;
+"""
+sa_event.listen(EventVersion.__table__, "after_create", DDL(_EVENT_VERSIONS_LZ4_DDL))
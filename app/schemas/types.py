@@ -0,0 +1,56 @@
+"""
+Custom SQLAlchemy column types.
+
+This module defines column types shared by the database models.
+"""
+
+import enum
+from typing import Dict, Optional, Type
+
+from sqlalchemy import SmallInteger
+from sqlalchemy.types import TypeDecorator
+
+class IntEnumType(TypeDecorator):
+    """
+    Store a Python enum as a SMALLINT code.
+
+    Codes come from an explicit mapping rather than declaration order, so
+    reordering or adding enum members never changes what is on disk.
+    Translation in both directions is a dict lookup.
+    """
+
+    impl = SmallInteger
+    cache_ok = True
+
+    def __init__(self, enum_class: Type[enum.Enum], codes: Dict[enum.Enum, int]):
+        """
+        Args:
+            enum_class: Enum stored in the column
+            codes: Integer code for every member of enum_class
+        """
+        super().__init__()
+        missing = set(enum_class) - set(codes)
+        if missing:
+            raise ValueError(f"No codes given for {enum_class.__name__} members: {missing}")
+        self.enum_class = enum_class
+        self._to_code = dict(codes)
+        self._to_member = {code: member for member, code in codes.items()}
+        # Enum's own value -> member map, skipping EnumMeta.__call__
+        self._by_value = enum_class._value2member_map_
+
+    def process_bind_param(self, value: Optional[enum.Enum], dialect) -> Optional[int]:
+        """Translate an enum member (or its value) to its code."""
+        if value is None:
+            return None
+        if not isinstance(value, self.enum_class):
+            try:
+                value = self._by_value[value]
+            except KeyError:
+                raise ValueError(f"{value!r} is not a valid {self.enum_class.__name__}") from None
+        return self._to_code[value]
+
+    def process_result_value(self, value: Optional[int], dialect) -> Optional[enum.Enum]:
+        """Translate a stored code back to its enum member."""
+        if value is None:
+            return None
+        return self._to_member[value]
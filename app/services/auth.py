@@ -4,10 +4,13 @@ Authentication service module.
 This module handles user authentication, password hashing, and JWT token management.
 """
 
-from datetime import datetime, timedelta
-from typing import Optional
-from jose import JWTError, jwt
+import time
+from concurrent.futures import Executor
+from datetime import timedelta
+from typing import Optional, Tuple
+from jose import JWTError, jwk, jwt
 from passlib.context import CryptContext
+from sqlalchemy import bindparam, select
 from sqlalchemy.orm import Session
 
 from app.core.config import settings
@@ -16,7 +19,23 @@ from app.schemas.user import User
 # Import Pydantic models for responses
 from app.models.user import UserInDB
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Argon2id for new hashes; bcrypt hashes still verify and are rehashed on login
+pwd_context = CryptContext(
+    schemes=["argon2", "bcrypt"],
+    deprecated=["bcrypt"],
+    argon2__type="ID",
+    argon2__memory_cost=19456,
+    argon2__time_cost=2,
+    argon2__parallelism=1,
+)
+
+# Token signing key, parsed once instead of on every encode/decode
+jwt_key = jwk.construct(settings.SECRET_KEY, algorithm=settings.ALGORITHM)
+_ACCESS_TOKEN_EXPIRE_SECONDS = settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60
+_JWT_ALGORITHM = settings.ALGORITHM
+
+# Built once at import so the hot lookup skips per-call Query construction.
+_USER_BY_NAME_STMT = select(User).where(User.username == bindparam("username"))
 
 class AuthenticationService:
     """Service class for handling authentication-related operations."""
@@ -26,6 +45,11 @@ class AuthenticationService:
         """Verify a password against its hash."""
         return pwd_context.verify(plain_password, hashed_password)
 
+    @staticmethod
+    def verify_and_update_password(plain_password: str, hashed_password: str) -> Tuple[bool, Optional[str]]:
+        """Verify a password, returning a replacement hash if the stored one is deprecated."""
+        return pwd_context.verify_and_update(plain_password, hashed_password)
+
     @staticmethod
     def get_password_hash(password: str) -> str:
         """Generate password hash."""
@@ -47,24 +71,17 @@ class AuthenticationService:
             str: Encoded JWT token
         """
         to_encode = data.copy()
-        if expires_delta:
-            expire = datetime.utcnow() + expires_delta
-        else:
-            expire = datetime.utcnow() + timedelta(
-                minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES
-            )
-        to_encode.update({"exp": expire})
-        return jwt.encode(
-            to_encode,
-            settings.SECRET_KEY,
-            algorithm=settings.ALGORITHM
-        )
+        lifetime = int(expires_delta.total_seconds()) if expires_delta else _ACCESS_TOKEN_EXPIRE_SECONDS
+        # Integer epoch seconds, as the JWT "exp" claim is defined
+        to_encode["exp"] = int(time.time()) + lifetime
+        return jwt.encode(to_encode, jwt_key, algorithm=_JWT_ALGORITHM)
 
     @staticmethod
     def authenticate_user(
         db: Session,
         username: str,
-        password: str
+        password: str,
+        hash_pool: Optional[Executor] = None
     ) -> Optional[User]:
         """
         Authenticate a user.
@@ -73,13 +90,40 @@ class AuthenticationService:
             db: Database session
             username: Username to authenticate
             password: Password to verify
+            hash_pool: Optional executor to run the password check in
             
         Returns:
             Optional[User]: Authenticated user or None
         """
-        user = db.query(User).filter(User.username == username).first()
+        user = AuthenticationService.get_user_by_username(db, username)
         if not user:
             return None
-        if not AuthenticationService.verify_password(password, user.hashed_password):
+        if hash_pool is None:
+            verified, new_hash = AuthenticationService.verify_and_update_password(
+                password, user.hashed_password
+            )
+        else:
+            verified, new_hash = hash_pool.submit(
+                AuthenticationService.verify_and_update_password, password, user.hashed_password
+            ).result()
+        if not verified:
             return None
+        if new_hash:
+            # Upgrade legacy bcrypt hashes to argon2id
+            user.hashed_password = new_hash
+            db.commit()
         return user
+
+    @staticmethod
+    def get_user_by_username(db: Session, username: str) -> Optional[User]:
+        """
+        Get a user by username.
+        
+        Args:
+            db: Database session
+            username: Username to look up
+            
+        Returns:
+            Optional[User]: User if found, None otherwise
+        """
+        return db.execute(_USER_BY_NAME_STMT, {"username": username}).scalar_one_or_none()
@@ -1,78 +1,129 @@
 """Batch event operations service."""
-from typing import List, Dict, Any, Optional
+import heapq
+import logging
+from typing import Dict, List, Optional
+from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session
-from app.models.event import Event
-from app.schemas.event import EventCreate, EventResponse
+from app.core.exceptions import BatchConflictError, BatchOperationError
+from app.dto.event import EventCreateDTO
+from app.models.event import EventBatchCreate, EventCreate
+from app.schemas.event import Event
+from app.schemas.user import User
 from app.services.event import EventService
-from app.core.exceptions import BatchOperationError
+
+MAX_BATCH_SIZE = 100
+
+logger = logging.getLogger(__name__)
 
 class BatchEventService:
     """Service for handling batch operations on events."""
 
     @staticmethod
-    async def create_batch_events(
-        db: Session,
-        events_data: List[EventCreate],
-        current_user_id: int,
-        max_batch_size: int = 100
-    ) -> List[EventResponse]:
+    def parse_batch_request(body: bytes) -> EventBatchCreate:
         """
-        Create multiple events in a single transaction.
+        Parse and validate a raw batch request body.
+        
+        The JSON is parsed and validated in a single pydantic-core pass
+        rather than decoded to Python objects first.
         
         Args:
-            db: Database session
-            events_data: List of event data
-            current_user_id: ID of the user creating events
-            max_batch_size: Maximum number of events in one batch
+            body: Raw JSON request body
             
         Returns:
-            List of created events
+            Validated batch request
             
         Raises:
-            BatchOperationError: If batch creation fails
+            ValidationError: If the body is not a valid batch request
         """
-        if len(events_data) > max_batch_size:
-            raise BatchOperationError(
-                f"Batch size exceeds maximum limit of {max_batch_size}"
-            )
-        
-        created_events = []
-        
-        try:
-            # Start transaction
-            for event_data in events_data:
-                event = await EventService.create_event(
-                    db=db,
-                    event_in=event_data,
-                    current_user_id=current_user_id
-                )
-                created_events.append(event)
-                
-            db.commit()
-            return created_events
-            
-        except Exception as e:
-            db.rollback()
-            raise BatchOperationError(f"Batch creation failed: {str(e)}")
+        return EventBatchCreate.model_validate_json(body)
 
     @staticmethod
-    async def validate_batch_request(
-        events_data: List[Dict[str, Any]]
+    def validate_batch_request(
+        events_data: List[EventCreate],
+        max_batch_size: int = MAX_BATCH_SIZE
     ) -> Optional[str]:
         """
         Validate batch request data.
         
         Args:
             events_data: List of event data to validate
+            max_batch_size: Maximum number of events in one batch
             
         Returns:
             Error message if validation fails, None otherwise
         """
         if not events_data:
             return "Empty batch request"
-            
-        for idx, event in enumerate(events_data):
-            if not all(k in event for k in ("title", "start_time", "end_time")):
-                return f"Missing required fields in event at index {idx}"
-                
+
+        if len(events_data) > max_batch_size:
+            return f"Batch size exceeds maximum limit of {max_batch_size}"
+
         return None
+
+    @staticmethod
+    def find_batch_overlaps(events: List[EventCreateDTO]) -> Dict[int, List[int]]:
+        """
+        Find events in a batch that overlap each other.
+        
+        Sweeps the events in start order, keeping a min-heap of the ones still
+        running keyed by end time, so the check is O(N log N) plus the number
+        of overlaps instead of comparing every pair.
+        
+        Args:
+            events: Events in the batch
+            
+        Returns:
+            Dict[int, List[int]]: Indexes of overlapping batch events keyed by batch index
+        """
+        overlaps: Dict[int, List[int]] = {}
+        active = []  # (end_time, index) of events that started earlier
+        for idx in sorted(range(len(events)), key=lambda i: events[i].start_time):
+            event = events[idx]
+            # Ranges are half-open, so an event ending at this start is clear
+            while active and active[0][0] <= event.start_time:
+                heapq.heappop(active)
+            for _, other in active:
+                overlaps.setdefault(idx, []).append(other)
+                overlaps.setdefault(other, []).append(idx)
+            heapq.heappush(active, (event.end_time, idx))
+        return overlaps
+
+    @staticmethod
+    def create_batch_events(
+        db: Session,
+        events_data: List[EventCreate],
+        current_user: User
+    ) -> List[Event]:
+        """
+        Check a batch for conflicts and create its events.
+        
+        Overlaps within the batch are found in memory and conflicts with
+        existing events with a single query, before anything is inserted.
+        
+        Args:
+            db: Database session
+            events_data: List of event data
+            current_user: User creating the events
+            
+        Returns:
+            List of created events
+            
+        Raises:
+            BatchConflictError: If any event overlaps an existing event or
+                another event in the batch
+            BatchOperationError: If the database rejects the batch
+        """
+        events = [EventCreateDTO.from_model(event_in) for event_in in events_data]
+
+        batch_overlaps = BatchEventService.find_batch_overlaps(events)
+        conflicts = EventService.detect_conflicts_bulk(db, events, current_user.id)
+        if conflicts or batch_overlaps:
+            raise BatchConflictError(conflicts, batch_overlaps)
+
+        try:
+            return EventService.batch_create_events(db, events, current_user)
+        except SQLAlchemyError as e:
+            db.rollback()
+            # Database errors carry SQL and parameters; keep them in the logs
+            logger.exception("Batch creation failed for user %s", current_user.id)
+            raise BatchOperationError("Batch creation failed") from e
@@ -7,16 +7,104 @@ recurrence handling, conflict detection, and versioning.
 
 from typing import List, Optional, Dict, Any, Tuple
 from datetime import datetime
-from sqlalchemy.orm import Session
-from sqlalchemy import or_, and_
-import json
-import copy
+from sqlalchemy.orm import Session, defer
+from sqlalchemy import DateTime, or_, bindparam, exists, func, literal, select, text, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.engine import Row
+from operator import attrgetter
 
+from app.core.exceptions import UserNotFoundError
 from app.schemas.user import User, UserRole
-from app.schemas.event import Event, EventPermission, EventVersion, RecurrencePattern
-from app.models.event import EventCreate, EventUpdate, EventResponse
+from app.schemas.event import Event, EventPermission, EventVersion
+from app.dto.event import EventCreateDTO
+from app.models.event import EventUpdate, EventResponse, event_snapshot_adapter
 from app.utils.rbac import RoleChecker
 
+# Hot lookups built once at import so each call only binds parameters.
+# Event ids start at 1, so exclude_id=0 excludes nothing. The overlap test is
+# written as tstzrange(start_time, end_time) && ... so it can use the GiST
+# index ix_events_time_range; half-open ranges match the old strict < / >.
+_CONFLICTS_STMT = select(Event).where(
+    or_(
+        Event.owner_id == bindparam("user_id"),
+        exists().where(
+            EventPermission.event_id == Event.id,
+            EventPermission.user_id == bindparam("user_id")
+        )
+    ),
+    Event.id != bindparam("exclude_id"),
+    func.tstzrange(Event.start_time, Event.end_time).op("&&")(
+        func.tstzrange(
+            bindparam("start_time", type_=DateTime(timezone=True)),
+            bindparam("end_time", type_=DateTime(timezone=True))
+        )
+    )
+)
+_EVENT_VERSION_STMT = select(EventVersion).where(
+    EventVersion.event_id == bindparam("event_id"),
+    EventVersion.version == bindparam("version")
+)
+
+# Event attributes captured in each version snapshot, read in one call
+_SNAPSHOT_FIELDS = (
+    "id", "title", "description", "start_time", "end_time", "location",
+    "is_recurring", "recurrence_pattern", "recurrence_rule", "owner_id",
+    "version", "created_at", "updated_at",
+)
+_snapshot_values = attrgetter(*_SNAPSHOT_FIELDS)
+
+# Change-description label per updatable field, and whether to show the
+# old and new values
+_CHANGE_LABELS = {
+    "title": ("Title", True),
+    "description": ("Description", False),
+    "start_time": ("Start time", True),
+    "end_time": ("End time", True),
+    "location": ("Location", True),
+    "is_recurring": ("Recurring status", True),
+    "recurrence_pattern": ("Recurrence pattern", True),
+    "recurrence_rule": ("Recurrence rule", False),
+}
+
+# Snapshot fields a rollback leaves untouched when the snapshot has no value
+_KEEP_IF_EMPTY = frozenset({"start_time", "end_time", "recurrence_pattern"})
+
+# Overlap of every candidate range against the events visible to a user, in one
+# round trip. The tstzrange(start_time, end_time) expression matches the GiST
+# index ix_events_time_range.
+_BULK_CONFLICTS_SQL = text("""
+    SELECT c.idx, e.id
+    FROM unnest(CAST(:starts AS timestamptz[]), CAST(:ends AS timestamptz[]))
+        WITH ORDINALITY AS c(start_time, end_time, idx)
+    JOIN events e
+        ON tstzrange(e.start_time, e.end_time) && tstzrange(c.start_time, c.end_time)
+    WHERE e.owner_id = :user_id
+       OR EXISTS (
+           SELECT 1 FROM event_permissions p
+           WHERE p.event_id = e.id AND p.user_id = :user_id
+       )
+""")
+
+# Field-level diff of two version snapshots computed in the database, so only
+# the changed fields come back rather than both full snapshots. Yields no row
+# when either version is missing; metadata fields are never reported.
+_VERSION_DIFF_SQL = text("""
+    SELECT COALESCE(
+        (SELECT jsonb_object_agg(k.key, jsonb_build_object(
+                    'version1', COALESCE(a.data -> k.key, 'null'::jsonb),
+                    'version2', COALESCE(b.data -> k.key, 'null'::jsonb)))
+         FROM (SELECT jsonb_object_keys(a.data) AS key
+               UNION
+               SELECT jsonb_object_keys(b.data)) AS k
+         WHERE k.key NOT IN ('id', 'created_at', 'updated_at')
+           AND COALESCE(a.data -> k.key, 'null'::jsonb)
+               IS DISTINCT FROM COALESCE(b.data -> k.key, 'null'::jsonb)),
+        '{}'::jsonb
+    ) AS diff
+    FROM event_versions a
+    JOIN event_versions b ON b.event_id = a.event_id
+    WHERE a.event_id = :event_id AND a.version = :version1 AND b.version = :version2
+""")
 
 class EventService:
     """Service for event-related operations."""
@@ -24,7 +112,7 @@ class EventService:
     @staticmethod
     def create_event(
         db: Session, 
-        event_in: EventCreate, 
+        event_in: EventCreateDTO, 
         current_user: User
     ) -> Event:
         """
@@ -52,16 +140,16 @@ class EventService:
         )
         
         db.add(event)
-        db.commit()
-        db.refresh(event)
+        db.flush()
         
-        # Create initial version
+        # Create initial version in the same transaction
         EventService.create_event_version(
             db=db,
             event=event,
             user_id=current_user.id,
             change_description="Initial creation"
         )
+        db.commit()
         
         return event
     
@@ -84,50 +172,27 @@ class EventService:
         Returns:
             Event: Updated event
         """
-        # Keep track of changes for version history
+        # Apply every provided field that differs, recording the change for
+        # version history; descriptions are only formatted for real changes
         changes = []
-        
-        # Handle each field that might be updated
-        if event_in.title is not None and event_in.title != event.title:
-            changes.append(f"Title changed from '{event.title}' to '{event_in.title}'")
-            event.title = event_in.title
-            
-        if event_in.description is not None and event_in.description != event.description:
-            changes.append("Description updated")
-            event.description = event_in.description
-            
-        if event_in.start_time is not None and event_in.start_time != event.start_time:
-            changes.append(f"Start time changed from '{event.start_time}' to '{event_in.start_time}'")
-            event.start_time = event_in.start_time
-            
-        if event_in.end_time is not None and event_in.end_time != event.end_time:
-            changes.append(f"End time changed from '{event.end_time}' to '{event_in.end_time}'")
-            event.end_time = event_in.end_time
-            
-        if event_in.location is not None and event_in.location != event.location:
-            changes.append(f"Location changed from '{event.location}' to '{event_in.location}'")
-            event.location = event_in.location
-            
-        if event_in.is_recurring is not None and event_in.is_recurring != event.is_recurring:
-            changes.append(f"Recurring status changed from '{event.is_recurring}' to '{event_in.is_recurring}'")
-            event.is_recurring = event_in.is_recurring
-            
-        if event_in.recurrence_pattern is not None and event_in.recurrence_pattern != event.recurrence_pattern:
-            changes.append(f"Recurrence pattern changed from '{event.recurrence_pattern}' to '{event_in.recurrence_pattern}'")
-            event.recurrence_pattern = event_in.recurrence_pattern
-            
-        if event_in.recurrence_rule is not None and event_in.recurrence_rule != event.recurrence_rule:
-            changes.append("Recurrence rule updated")
-            event.recurrence_rule = event_in.recurrence_rule
+        for field, new_value in event_in.model_dump(exclude_unset=True).items():
+            old_value = getattr(event, field)
+            if new_value is None or new_value == old_value:
+                continue
+            label, show_values = _CHANGE_LABELS[field]
+            if show_values:
+                changes.append(f"{label} changed from '{old_value}' to '{new_value}'")
+            else:
+                changes.append(f"{label} updated")
+            setattr(event, field, new_value)
         
         # Increment version and update timestamp
         event.version += 1
         
         db.add(event)
-        db.commit()
-        db.refresh(event)
+        db.flush()
         
-        # Create new version
+        # Create new version in the same transaction
         change_description = "; ".join(changes) if changes else "Event updated (no changes detected)"
         EventService.create_event_version(
             db=db,
@@ -135,6 +200,7 @@ class EventService:
             user_id=current_user.id,
             change_description=change_description
         )
+        db.commit()
         
         return event
     
@@ -158,10 +224,13 @@ class EventService:
         limit: int = 100,
         start_date: Optional[datetime] = None,
         end_date: Optional[datetime] = None
-    ) -> List[Event]:
+    ) -> List[Row]:
         """
         Get list of events accessible to the current user, with optional date filtering.
         
+        Rows carry the event columns as attributes but are not ORM instances,
+        so listings skip identity-map bookkeeping and object construction.
+        
         Args:
             db: Database session
             current_user: Current user
@@ -171,18 +240,19 @@ class EventService:
             end_date: Optional end date for filtering
             
         Returns:
-            List[Event]: List of accessible events
+            List[Row]: Column rows of the accessible events
         """
-        # Base query for events owned by the user
-        query = db.query(Event).filter(
+        # Base query for events owned by the user; listings serialize columns
+        # only, so fetch plain rows rather than Event instances
+        query = db.query(*Event.__table__.c).filter(
             or_(
                 # User is the owner
                 Event.owner_id == current_user.id,
-                # User has permission
-                Event.id.in_(
-                    db.query(EventPermission.event_id)
-                    .filter(EventPermission.user_id == current_user.id)
-                    .subquery()
+                # User has permission; a correlated EXISTS lets the planner
+                # semi-join on ix_event_permissions_user_event
+                exists().where(
+                    EventPermission.event_id == Event.id,
+                    EventPermission.user_id == current_user.id
                 )
             )
         )
@@ -210,6 +280,23 @@ class EventService:
         """
         return db.query(Event).filter(Event.id == event_id).first()
     
+    @staticmethod
+    def snapshot_event(event: Event) -> Dict[str, Any]:
+        """
+        Build the JSON snapshot stored in an event version.
+        
+        Datetimes and enums are left as-is; the engine's orjson serializer
+        encodes them natively, producing the same ISO 8601 strings and enum
+        values that were previously converted here.
+        
+        Args:
+            event: Event to snapshot
+            
+        Returns:
+            Dict[str, Any]: Event data for the JSONB snapshot column
+        """
+        return dict(zip(_SNAPSHOT_FIELDS, _snapshot_values(event)))
+    
     @staticmethod
     def create_event_version(
         db: Session, 
@@ -220,6 +307,9 @@ class EventService:
         """
         Create a new version of an event.
         
+        The version is flushed but not committed; the caller commits it
+        together with the change it records.
+        
         Args:
             db: Database session
             event: Event to version
@@ -230,21 +320,7 @@ class EventService:
             EventVersion: New event version
         """
         # Create JSON snapshot of the event
-        event_data = {
-            "id": event.id,
-            "title": event.title,
-            "description": event.description,
-            "start_time": event.start_time.isoformat() if event.start_time else None,
-            "end_time": event.end_time.isoformat() if event.end_time else None,
-            "location": event.location,
-            "is_recurring": event.is_recurring,
-            "recurrence_pattern": event.recurrence_pattern.value if event.recurrence_pattern else None,
-            "recurrence_rule": event.recurrence_rule,
-            "owner_id": event.owner_id,
-            "version": event.version,
-            "created_at": event.created_at.isoformat() if event.created_at else None,
-            "updated_at": event.updated_at.isoformat() if event.updated_at else None
-        }
+        event_data = EventService.snapshot_event(event)
         
         # Create version record
         event_version = EventVersion(
@@ -256,8 +332,7 @@ class EventService:
         )
         
         db.add(event_version)
-        db.commit()
-        db.refresh(event_version)
+        db.flush()
         
         return event_version
     
@@ -271,9 +346,10 @@ class EventService:
             event_id: Event ID
             
         Returns:
-            List[EventVersion]: List of event versions
+            List[EventVersion]: List of event versions, without their snapshot data loaded
         """
-        return db.query(EventVersion).filter(
+        # The changelog lists version metadata only; leave the snapshots in storage
+        return db.query(EventVersion).options(defer(EventVersion.data)).filter(
             EventVersion.event_id == event_id
         ).order_by(EventVersion.version.desc()).all()
     
@@ -294,10 +370,9 @@ class EventService:
         Returns:
             Optional[EventVersion]: Event version if found, None otherwise
         """
-        return db.query(EventVersion).filter(
-            EventVersion.event_id == event_id,
-            EventVersion.version == version
-        ).first()
+        return db.execute(
+            _EVENT_VERSION_STMT, {"event_id": event_id, "version": version}
+        ).scalar_one_or_none()
     
     @staticmethod
     def rollback_event(
@@ -323,49 +398,35 @@ class EventService:
         if not event_version:
             return None
         
-        # Get the version data
-        version_data = event_version.data
-        
-        # Update the event fields to match the version
-        event.title = version_data.get("title", event.title)
-        event.description = version_data.get("description", event.description)
-        
-        # Handle date fields
-        if "start_time" in version_data and version_data["start_time"]:
-            event.start_time = datetime.fromisoformat(version_data["start_time"])
-        if "end_time" in version_data and version_data["end_time"]:
-            event.end_time = datetime.fromisoformat(version_data["end_time"])
-            
-        event.location = version_data.get("location", event.location)
-        event.is_recurring = version_data.get("is_recurring", event.is_recurring)
-        
-        # Handle enum fields
-        if "recurrence_pattern" in version_data and version_data["recurrence_pattern"]:
-            event.recurrence_pattern = RecurrencePattern(version_data["recurrence_pattern"])
-        
-        event.recurrence_rule = version_data.get("recurrence_rule", event.recurrence_rule)
+        # Restore the snapshot's fields; empty times and patterns keep the
+        # event's current values
+        snapshot = event_snapshot_adapter.validate_python(event_version.data)
+        for field, value in snapshot.items():
+            if value is None and field in _KEEP_IF_EMPTY:
+                continue
+            setattr(event, field, value)
         
         # Increment version
         event.version += 1
         
         db.add(event)
-        db.commit()
-        db.refresh(event)
+        db.flush()
         
-        # Create new version record
+        # Create new version record in the same transaction
         EventService.create_event_version(
             db=db,
             event=event,
             user_id=current_user.id,
             change_description=f"Rolled back to version {version}"
         )
+        db.commit()
         
         return event
     
     @staticmethod
     def detect_conflicts(
         db: Session, 
-        event_in: EventCreate, 
+        event_in: EventCreateDTO, 
         user_id: int,
         event_id: Optional[int] = None
     ) -> List[Event]:
@@ -381,33 +442,50 @@ class EventService:
         Returns:
             List[Event]: List of conflicting events
         """
-        # Base query for events owned by or shared with the user
-        query = db.query(Event).filter(
-            or_(
-                # User is the owner
-                Event.owner_id == user_id,
-                # User has permission
-                Event.id.in_(
-                    db.query(EventPermission.event_id)
-                    .filter(EventPermission.user_id == user_id)
-                    .subquery()
-                )
-            )
+        # Events owned by or shared with the user whose time ranges overlap
+        return db.execute(
+            _CONFLICTS_STMT,
+            {
+                "user_id": user_id,
+                "exclude_id": event_id or 0,
+                "start_time": event_in.start_time,
+                "end_time": event_in.end_time
+            }
+        ).scalars().all()
+    
+    @staticmethod
+    def detect_conflicts_bulk(
+        db: Session,
+        candidates: List[EventCreateDTO],
+        user_id: int
+    ) -> Dict[int, List[int]]:
+        """
+        Detect conflicting events for several candidate events in a single query.
+        
+        Args:
+            db: Database session
+            candidates: Event data to check for conflicts
+            user_id: User ID to check conflicts for
+            
+        Returns:
+            Dict[int, List[int]]: Conflicting event IDs keyed by candidate index
+        """
+        if not candidates:
+            return {}
+        
+        rows = db.execute(
+            _BULK_CONFLICTS_SQL,
+            {
+                "starts": [candidate.start_time for candidate in candidates],
+                "ends": [candidate.end_time for candidate in candidates],
+                "user_id": user_id
+            }
         )
         
-        # Exclude the current event if event_id is provided (for updates)
-        if event_id:
-            query = query.filter(Event.id != event_id)
-        
-        # Check for time conflicts
-        conflicts = query.filter(
-            and_(
-                # New event starts before existing event ends
-                event_in.start_time < Event.end_time,
-                # New event ends after existing event starts
-                event_in.end_time > Event.start_time
-            )
-        ).all()
+        conflicts: Dict[int, List[int]] = {}
+        for idx, event_id in rows:
+            # WITH ORDINALITY numbers from 1
+            conflicts.setdefault(idx - 1, []).append(event_id)
         
         return conflicts
     
@@ -417,7 +495,7 @@ class EventService:
         event_id: int,
         version1: int,
         version2: int
-    ) -> Dict[str, Any]:
+    ) -> Optional[Dict[str, Any]]:
         """
         Calculate differences between two event versions.
         
@@ -428,40 +506,13 @@ class EventService:
             version2: Second version for comparison
             
         Returns:
-            Dict[str, Any]: Dictionary of differences
+            Optional[Dict[str, Any]]: Dictionary of differences, or None if
+            either version does not exist
         """
-        # Get both versions
-        event_version1 = EventService.get_event_version(db, event_id, version1)
-        event_version2 = EventService.get_event_version(db, event_id, version2)
-        
-        if not event_version1 or not event_version2:
-            return None
-        
-        # Get the data from both versions
-        data1 = event_version1.data
-        data2 = event_version2.data
-        
-        # Calculate differences
-        diff = {}
-        
-        # Compare each field
-        for key in set(list(data1.keys()) + list(data2.keys())):
-            # Skip metadata fields
-            if key in ["id", "created_at", "updated_at"]:
-                continue
-                
-            # Check if field exists in both versions
-            value1 = data1.get(key)
-            value2 = data2.get(key)
-            
-            # Add to diff if values are different
-            if value1 != value2:
-                diff[key] = {
-                    "version1": value1,
-                    "version2": value2
-                }
-        
-        return diff
+        return db.execute(
+            _VERSION_DIFF_SQL,
+            {"event_id": event_id, "version1": version1, "version2": version2}
+        ).scalar()
     
     @staticmethod
     def share_event(
@@ -480,32 +531,34 @@ class EventService:
             role: Role to assign
             
         Returns:
-            EventPermission: Created permission
-        """
-        # Check if permission already exists
-        existing_permission = db.query(EventPermission).filter(
-            EventPermission.event_id == event.id,
-            EventPermission.user_id == user_id
-        ).first()
-        
-        if existing_permission:
-            # Update existing permission
-            existing_permission.role = role
-            db.add(existing_permission)
-            db.commit()
-            db.refresh(existing_permission)
-            return existing_permission
-        
-        # Create new permission
-        permission = EventPermission(
-            event_id=event.id,
-            user_id=user_id,
-            role=role
+            EventPermission: Created or updated permission
+            
+        Raises:
+            UserNotFoundError: If the user does not exist
+        """
+        # Insert or update the permission in one statement, guarded by the
+        # user's existence; ix_event_permissions_user_event is the conflict target
+        insert_stmt = insert(EventPermission).from_select(
+            ["event_id", "user_id", "role"],
+            select(
+                literal(event.id),
+                literal(user_id),
+                literal(role, EventPermission.role.type)
+            ).where(exists().where(User.id == user_id))
         )
+        insert_stmt = insert_stmt.on_conflict_do_update(
+            index_elements=["user_id", "event_id"],
+            set_={"role": insert_stmt.excluded.role, "updated_at": func.now()}
+        ).returning(*EventPermission.__table__.c)
+        
+        permission = db.execute(
+            select(EventPermission).from_statement(insert_stmt),
+            execution_options={"populate_existing": True}
+        ).scalar_one_or_none()
+        if permission is None:
+            raise UserNotFoundError(f"User {user_id} not found")
         
-        db.add(permission)
         db.commit()
-        db.refresh(permission)
         
         return permission
     
@@ -547,18 +600,24 @@ class EventService:
         Returns:
             Optional[EventPermission]: Updated permission if found, None otherwise
         """
-        permission = db.query(EventPermission).filter(
-            EventPermission.event_id == event_id,
-            EventPermission.user_id == user_id
-        ).first()
+        update_stmt = (
+            update(EventPermission)
+            .where(
+                EventPermission.event_id == event_id,
+                EventPermission.user_id == user_id
+            )
+            .values(role=role)
+            .returning(*EventPermission.__table__.c)
+        )
+        permission = db.execute(
+            select(EventPermission).from_statement(update_stmt),
+            execution_options={"populate_existing": True}
+        ).scalar_one_or_none()
         
         if not permission:
             return None
         
-        permission.role = role
-        db.add(permission)
         db.commit()
-        db.refresh(permission)
         
         return permission
     
@@ -595,7 +654,7 @@ class EventService:
     @staticmethod
     def batch_create_events(
         db: Session,
-        events_in: List[EventCreate],
+        events_in: List[EventCreateDTO],
         current_user: User
     ) -> List[Event]:
         """
@@ -609,38 +668,43 @@ class EventService:
         Returns:
             List[Event]: List of created events
         """
-        events = []
-        
-        for event_in in events_in:
-            # Create the event
-            event = Event(
-                title=event_in.title,
-                description=event_in.description,
-                start_time=event_in.start_time,
-                end_time=event_in.end_time,
-                location=event_in.location,
-                is_recurring=event_in.is_recurring,
-                recurrence_pattern=event_in.recurrence_pattern,
-                recurrence_rule=event_in.recurrence_rule,
-                owner_id=current_user.id
+        # Insert all events in one statement and load the returned rows
+        rows = [
+            {
+                "title": event_in.title,
+                "description": event_in.description,
+                "start_time": event_in.start_time,
+                "end_time": event_in.end_time,
+                "location": event_in.location,
+                "is_recurring": event_in.is_recurring,
+                "recurrence_pattern": event_in.recurrence_pattern,
+                "recurrence_rule": event_in.recurrence_rule,
+                "owner_id": current_user.id,
+                "version": 1
+            }
+            for event_in in events_in
+        ]
+        events = db.execute(
+            select(Event).from_statement(
+                insert(Event).values(rows).returning(*Event.__table__.c)
             )
-            
-            db.add(event)
-            events.append(event)
+        ).scalars().all()
+        
+        # Insert the initial version of every event in one more statement
+        db.execute(
+            insert(EventVersion).values([
+                {
+                    "event_id": event.id,
+                    "version": event.version,
+                    "data": EventService.snapshot_event(event),
+                    "changed_by_id": current_user.id,
+                    "change_description": "Initial creation (batch)"
+                }
+                for event in events
+            ])
+        )
         
-        # Commit all events at once
+        # Events and their versions are committed together
         db.commit()
         
-        # Refresh all events to get their IDs
-        for event in events:
-            db.refresh(event)
-            
-            # Create initial version for each event
-            EventService.create_event_version(
-                db=db,
-                event=event,
-                user_id=current_user.id,
-                change_description="Initial creation (batch)"
-            )
-        
         return events
@@ -4,15 +4,79 @@ Role-based access control utilities.
 This module provides helper functions for handling permissions and access control.
 """
 
-from typing import List, Optional
-from fastapi import Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from typing import Dict, List, Optional
+from fastapi import Depends, HTTPException, Request, status
+from sqlalchemy import bindparam, inspect, select
+from sqlalchemy.orm import Session, raiseload
+from sqlalchemy.orm.attributes import set_committed_value
 
 from app.db.base import get_db
 from app.schemas.user import User, UserRole
 from app.schemas.event import Event, EventPermission
 from app.api.v1.endpoints.auth import get_current_user
 
+# Built once at import; the event fetch runs on every event-scoped request.
+# Relationships are never lazy loaded: permissions are fetched explicitly
+# with load_event_permissions only when a check or serializer needs them.
+_EVENT_BY_ID_STMT = select(Event).options(raiseload("*")).where(Event.id == bindparam("event_id"))
+_PERMISSIONS_BY_EVENT_STMT = (
+    select(EventPermission)
+    .options(raiseload("*"))
+    .where(EventPermission.event_id == bindparam("event_id"))
+)
+
+
+def load_event_permissions(db: Session, event: Event) -> List[EventPermission]:
+    """
+    Load an event's permissions collection if it isn't loaded yet.
+    
+    Args:
+        db: Database session
+        event: Event whose permissions are needed
+        
+    Returns:
+        List[EventPermission]: The event's permissions
+    """
+    if "permissions" in inspect(event).unloaded:
+        permissions = db.execute(_PERMISSIONS_BY_EVENT_STMT, {"event_id": event.id}).scalars().all()
+        set_committed_value(event, "permissions", permissions)
+    return event.permissions
+
+
+# Only the columns a permission check reads, not full permission rows.
+# Roles are read fresh on every request so a permission change applies at once
+# across all workers; the owner short-circuit and the per-request event cache
+# already keep repeat queries out of the common paths.
+_ROLES_BY_EVENT_STMT = (
+    select(EventPermission.user_id, EventPermission.role)
+    .where(EventPermission.event_id == bindparam("event_id"))
+)
+
+
+def load_event_roles(db: Session, event: Event) -> Dict[int, UserRole]:
+    """
+    Get the roles of users an event is shared with.
+    
+    The result is also set as the event's role_by_user_id, which RoleChecker
+    consults for non-owners; an event already checked in this request, and
+    so memoized on its state, is not queried again.
+    
+    Args:
+        db: Database session
+        event: Event whose shared roles are needed
+        
+    Returns:
+        Dict[int, UserRole]: Roles keyed by user ID
+    """
+    if "role_by_user_id" in vars(event):
+        return event.role_by_user_id
+    if "permissions" in inspect(event).unloaded:
+        roles = dict(db.execute(_ROLES_BY_EVENT_STMT, {"event_id": event.id}).all())
+    else:
+        roles = {permission.user_id: permission.role for permission in event.permissions}
+    event.role_by_user_id = roles
+    return roles
+
 
 class RoleChecker:
     """
@@ -34,12 +98,9 @@ class RoleChecker:
         """Get the user's role for an event."""
         if RoleChecker.is_event_owner(user_id, event):
             return UserRole.OWNER
-            
-        for permission in event.permissions:
-            if permission.user_id == user_id:
-                return permission.role
-                
-        return None
+        
+        # Dict lookup, built on first use, rather than a scan per check
+        return event.role_by_user_id.get(user_id)
     
     @staticmethod
     def can_view_event(user_id: int, event: Event) -> bool:
@@ -69,15 +130,20 @@ def get_event_with_permission_check(
     current_user: User = Depends(get_current_user),
     permission_type: str = "view",
     db: Session = Depends(get_db),
+    request: Optional[Request] = None,
 ) -> Event:
     """
     Get an event with permission check.
     
+    When a request is given, the fetched event is memoized on its state so
+    further checks in the same request don't query it again.
+    
     Args:
         event_id: ID of the event to retrieve
         current_user: Current authenticated user
         permission_type: Type of permission required (view, edit, delete, manage)
         db: Database session
+        request: Optional current request used for per-request memoization
         
     Returns:
         Event: The requested event
@@ -85,13 +151,29 @@ def get_event_with_permission_check(
     Raises:
         HTTPException: If event not found or permission denied
     """
-    event = db.query(Event).filter(Event.id == event_id).first()
+    event_cache = None
+    if request is not None:
+        event_cache = getattr(request.state, "event_cache", None)
+        if event_cache is None:
+            event_cache = request.state.event_cache = {}
+    
+    if event_cache is not None and event_id in event_cache:
+        event = event_cache[event_id]
+    else:
+        event = db.execute(_EVENT_BY_ID_STMT, {"event_id": event_id}).scalar_one_or_none()
+        if event_cache is not None:
+            event_cache[event_id] = event
     if not event:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Event not found"
         )
     
+    # Owners pass every check on owner_id alone; only shared access to view
+    # or edit depends on the event's permissions.
+    if permission_type in ("view", "edit") and not RoleChecker.is_event_owner(current_user.id, event):
+        load_event_roles(db, event)
+    
     has_permission = False
     
     if permission_type == "view":
@@ -110,3 +192,43 @@ def get_event_with_permission_check(
         )
     
     return event
+
+
+def require_view(
+    event_id: int,
+    request: Request,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db),
+) -> Event:
+    """Dependency returning an event the current user can view."""
+    return get_event_with_permission_check(event_id, current_user, "view", db, request)
+
+
+def require_edit(
+    event_id: int,
+    request: Request,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db),
+) -> Event:
+    """Dependency returning an event the current user can edit."""
+    return get_event_with_permission_check(event_id, current_user, "edit", db, request)
+
+
+def require_delete(
+    event_id: int,
+    request: Request,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db),
+) -> Event:
+    """Dependency returning an event the current user can delete."""
+    return get_event_with_permission_check(event_id, current_user, "delete", db, request)
+
+
+def require_manage(
+    event_id: int,
+    request: Request,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db),
+) -> Event:
+    """Dependency returning an event whose permissions the current user can manage."""
+    return get_event_with_permission_check(event_id, current_user, "manage", db, request)
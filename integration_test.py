@@ -5,18 +5,60 @@ This script tests the integration between Day 1 (Authentication) and Day 2 (Even
 implementations, demonstrating a complete user flow from registration to event collaboration.
 """
 
+import os
 import requests
-import json
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import orjson
 from datetime import datetime, timedelta
-import time
 import sys
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any, Optional, List, Tuple
 
-# Base URL for API
-BASE_URL = "http://localhost:8000/api/v1"
+# Server under test; every test script reads TEST_SERVER_URL so one setting
+# points them all at another host or port. Defaults to uvicorn's bind address
+# (see test_event_endpoints.py for why it is not localhost).
+SERVER_URL = os.environ.get("TEST_SERVER_URL", "http://127.0.0.1:8000").rstrip("/")
+BASE_URL = f"{SERVER_URL}/api/v1"
+HEALTH_URL = f"{SERVER_URL}/health"
 AUTH_URL = f"{BASE_URL}/auth"
 EVENTS_URL = f"{BASE_URL}/events"
 
+# (connect, read) seconds, so a hung server fails a step instead of stalling the run
+TIMEOUT = (3.05, 10)
+
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+def json_body(value: Any) -> Dict[str, Any]:
+    """Request keyword arguments sending value as an orjson-encoded JSON body."""
+    return {"data": orjson.dumps(value), "headers": JSON_HEADERS}
+
+def parse_json(response: requests.Response) -> Any:
+    """Decode a response body with orjson."""
+    return orjson.loads(response.content)
+
+def new_session(token: Optional[str] = None) -> requests.Session:
+    """
+    Create a pooled keep-alive session, optionally authenticated.
+    
+    Only failed connects are retried: those never reached the server, whereas
+    replaying a POST that did could register or create things twice.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=16,
+        max_retries=Retry(total=2, connect=2, read=0, status=0, backoff_factor=0.1),
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.headers.update({"Accept": "application/json"})
+    if token:
+        session.headers["Authorization"] = f"Bearer {token}"
+    return session
+
 class IntegrationTest:
     """
     Integration test class that follows SOLID principles with single responsibility
@@ -33,35 +75,38 @@ class IntegrationTest:
         self.participant_token = None
         self.event_id = None
         self.test_results = []
+        self.passed = 0
+        self.failed = 0
+        # (step name, seconds) so slow endpoints show up between runs
+        self.step_timings = []
+        # Unauthenticated session for register/login; each user gets its own
+        # session carrying their token once logged in
+        self.session = new_session()
+        self.admin_session = None
+        self.organizer_session = None
+        self.participant_session = None
     
     def run_all_tests(self):
         """Run all integration tests in sequence."""
         print("\n🔄 RUNNING INTEGRATION TESTS FOR EVENT MANAGEMENT SYSTEM 🔄\n")
         
         try:
-            # Step 1: Setup users
-            self.setup_users()
-            
-            # Step 2: Login users
-            self.login_users()
-            
-            # Step 3: Create event
-            self.create_event()
-            
-            # Step 4: Event operations
-            self.test_event_operations()
-            
-            # Step 5: Collaboration
-            self.test_collaboration()
-            
-            # Step 6: Versioning
-            self.test_versioning()
-            
-            # Step 7: Permission changes
-            self.test_permission_changes()
+            self.warmup()
             
-            # Step 8: Cleanup
-            self.cleanup()
+            steps = [
+                self.setup_users,             # Step 1
+                self.login_users,             # Step 2
+                self.create_event,            # Step 3
+                self.test_event_operations,   # Step 4
+                self.test_collaboration,      # Step 5
+                self.test_versioning,         # Step 6
+                self.test_permission_changes, # Step 7
+                self.cleanup,                 # Step 8
+            ]
+            for step in steps:
+                start = time.perf_counter()
+                step()
+                self.step_timings.append((step.__name__, time.perf_counter() - start))
             
             # Print results
             self.print_results()
@@ -70,6 +115,13 @@ class IntegrationTest:
             print(f"❌ Test execution failed: {str(e)}")
             sys.exit(1)
     
+    def warmup(self):
+        """Open a pooled connection with a cheap untimed request before step 1."""
+        try:
+            self.session.get(HEALTH_URL, timeout=TIMEOUT)
+        except requests.RequestException as e:
+            print(f"Warmup failed: {str(e)}")
+    
     def record_result(self, test_name: str, success: bool, message: str):
         """Record test result with details."""
         self.test_results.append({
@@ -79,34 +131,39 @@ class IntegrationTest:
         })
         
         if success:
+            self.passed += 1
             print(f"✅ {test_name}: {message}")
         else:
+            self.failed += 1
             print(f"❌ {test_name}: {message}")
     
     def setup_users(self):
         """Register test users with different roles."""
         print("\n📋 STEP 1: REGISTERING USERS\n")
         
-        # Register admin user
-        self.admin = self.register_user({
-            "email": f"admin_{int(time.time())}@example.com",
-            "username": f"admin_{int(time.time())}",
-            "password": "AdminPass123"
-        })
-        
-        # Register organizer
-        self.organizer = self.register_user({
-            "email": f"organizer_{int(time.time())}@example.com",
-            "username": f"organizer_{int(time.time())}",
-            "password": "OrganizerPass123"
-        })
-        
-        # Register participant
-        self.participant = self.register_user({
-            "email": f"participant_{int(time.time())}@example.com",
-            "username": f"participant_{int(time.time())}",
-            "password": "ParticipantPass123"
-        })
+        # One random suffix per run keeps names unique across runs and consistent within one
+        suffix = uuid.uuid4().hex[:8]
+        
+        # The three registrations are independent, so send them together
+        payloads = [
+            {
+                "email": f"admin_{suffix}@example.com",
+                "username": f"admin_{suffix}",
+                "password": "AdminPass123"
+            },
+            {
+                "email": f"organizer_{suffix}@example.com",
+                "username": f"organizer_{suffix}",
+                "password": "OrganizerPass123"
+            },
+            {
+                "email": f"participant_{suffix}@example.com",
+                "username": f"participant_{suffix}",
+                "password": "ParticipantPass123"
+            },
+        ]
+        with ThreadPoolExecutor(max_workers=len(payloads)) as executor:
+            self.admin, self.organizer, self.participant = executor.map(self.register_user, payloads)
         
         if self.admin and self.organizer and self.participant:
             self.record_result(
@@ -127,16 +184,21 @@ class IntegrationTest:
         """Login all users and get tokens."""
         print("\n🔑 STEP 2: LOGGING IN USERS\n")
         
-        # Login as admin
-        self.admin_token = self.login_user(self.admin["username"], "AdminPass123")
-        
-        # Login as organizer
-        self.organizer_token = self.login_user(self.organizer["username"], "OrganizerPass123")
-        
-        # Login as participant
-        self.participant_token = self.login_user(self.participant["username"], "ParticipantPass123")
+        # Likewise the logins, which are dominated by password verification
+        credentials = [
+            (self.admin["username"], "AdminPass123"),
+            (self.organizer["username"], "OrganizerPass123"),
+            (self.participant["username"], "ParticipantPass123"),
+        ]
+        with ThreadPoolExecutor(max_workers=len(credentials)) as executor:
+            self.admin_token, self.organizer_token, self.participant_token = executor.map(
+                lambda args: self.login_user(*args), credentials
+            )
         
         if self.admin_token and self.organizer_token and self.participant_token:
+            self.admin_session = new_session(self.admin_token)
+            self.organizer_session = new_session(self.organizer_token)
+            self.participant_session = new_session(self.participant_token)
             self.record_result(
                 "User Authentication", 
                 True, 
@@ -164,14 +226,14 @@ class IntegrationTest:
             "is_recurring": False
         }
         
-        response = requests.post(
+        response = self.organizer_session.post(
             EVENTS_URL,
-            json=event_data,
-            headers={"Authorization": f"Bearer {self.organizer_token}"}
+            **json_body(event_data),
+            timeout=TIMEOUT
         )
         
         if response.status_code == 201:
-            event = response.json()
+            event = parse_json(response)
             self.event_id = event["id"]
             self.record_result(
                 "Event Creation", 
@@ -185,7 +247,7 @@ class IntegrationTest:
                 f"Failed to create event: {response.status_code}"
             )
             try:
-                print(response.json())
+                print(parse_json(response))
             except:
                 print(response.text)
             sys.exit(1)
@@ -195,14 +257,14 @@ class IntegrationTest:
         print("\n🔄 STEP 4: TESTING EVENT OPERATIONS\n")
         
         # Get all events for organizer
-        response = requests.get(
+        response = self.organizer_session.get(
             EVENTS_URL,
-            headers={"Authorization": f"Bearer {self.organizer_token}"}
+            timeout=TIMEOUT
         )
         
         if response.status_code == 200:
-            events = response.json()
-            if len(events) > 0 and any(e["id"] == self.event_id for e in events):
+            events = parse_json(response)
+            if any(e["id"] == self.event_id for e in events):
                 self.record_result(
                     "List Events", 
                     True, 
@@ -222,13 +284,13 @@ class IntegrationTest:
             )
         
         # Get specific event
-        response = requests.get(
+        response = self.organizer_session.get(
             f"{EVENTS_URL}/{self.event_id}",
-            headers={"Authorization": f"Bearer {self.organizer_token}"}
+            timeout=TIMEOUT
         )
         
         if response.status_code == 200:
-            event = response.json()
+            event = parse_json(response)
             if event["id"] == self.event_id:
                 self.record_result(
                     "Get Event Detail", 
@@ -254,14 +316,14 @@ class IntegrationTest:
             "description": "This event has been updated during integration testing"
         }
         
-        response = requests.put(
+        response = self.organizer_session.put(
             f"{EVENTS_URL}/{self.event_id}",
-            json=update_data,
-            headers={"Authorization": f"Bearer {self.organizer_token}"}
+            **json_body(update_data),
+            timeout=TIMEOUT
         )
         
         if response.status_code == 200:
-            updated_event = response.json()
+            updated_event = parse_json(response)
             if (updated_event["title"] == update_data["title"] and 
                 updated_event["description"] == update_data["description"]):
                 self.record_result(
@@ -292,10 +354,10 @@ class IntegrationTest:
             "role": "editor"
         }
         
-        response = requests.post(
+        response = self.organizer_session.post(
             f"{EVENTS_URL}/{self.event_id}/share",
-            json=share_data,
-            headers={"Authorization": f"Bearer {self.organizer_token}"}
+            **json_body(share_data),
+            timeout=TIMEOUT
         )
         
         if response.status_code == 200:
@@ -313,21 +375,16 @@ class IntegrationTest:
             return
         
         # Participant views shared event
-        response = requests.get(
+        response = self.participant_session.get(
             f"{EVENTS_URL}/{self.event_id}",
-            headers={"Authorization": f"Bearer {self.participant_token}"}
+            timeout=TIMEOUT
         )
         
         if response.status_code == 200:
-            event = response.json()
-            permissions_found = False
+            event = parse_json(response)
+            roles_by_user = {p["user_id"]: p["role"] for p in event.get("permissions", [])}
             
-            for permission in event.get("permissions", []):
-                if permission["user_id"] == self.participant["id"] and permission["role"] == "editor":
-                    permissions_found = True
-                    break
-            
-            if permissions_found:
+            if roles_by_user.get(self.participant["id"]) == "editor":
                 self.record_result(
                     "View Shared Event", 
                     True, 
@@ -351,14 +408,14 @@ class IntegrationTest:
             "description": "This event has been updated by participant"
         }
         
-        response = requests.put(
+        response = self.participant_session.put(
             f"{EVENTS_URL}/{self.event_id}",
-            json=update_data,
-            headers={"Authorization": f"Bearer {self.participant_token}"}
+            **json_body(update_data),
+            timeout=TIMEOUT
         )
         
         if response.status_code == 200:
-            updated_event = response.json()
+            updated_event = parse_json(response)
             if updated_event["description"] == update_data["description"]:
                 self.record_result(
                     "Update as Collaborator", 
@@ -383,13 +440,13 @@ class IntegrationTest:
         print("\n📚 STEP 6: TESTING VERSION HISTORY\n")
         
         # Get event changelog
-        response = requests.get(
+        response = self.organizer_session.get(
             f"{EVENTS_URL}/{self.event_id}/changelog",
-            headers={"Authorization": f"Bearer {self.organizer_token}"}
+            timeout=TIMEOUT
         )
         
         if response.status_code == 200:
-            versions = response.json()
+            versions = parse_json(response)
             if len(versions) >= 3:  # Initial + organizer update + participant update
                 self.record_result(
                     "Version History", 
@@ -403,13 +460,13 @@ class IntegrationTest:
                     v1_id = versions[-1]["version"]  # Oldest version
                     v2_id = versions[0]["version"]   # Newest version
                     
-                    response = requests.get(
+                    response = self.organizer_session.get(
                         f"{EVENTS_URL}/{self.event_id}/diff/{v1_id}/{v2_id}",
-                        headers={"Authorization": f"Bearer {self.organizer_token}"}
+                        timeout=TIMEOUT
                     )
                     
                     if response.status_code == 200:
-                        diff = response.json()
+                        diff = parse_json(response)
                         if "diff" in diff and len(diff["diff"]) > 0:
                             self.record_result(
                                 "Version Diff", 
@@ -450,10 +507,10 @@ class IntegrationTest:
             "role": "viewer"
         }
         
-        response = requests.put(
+        response = self.organizer_session.put(
             f"{EVENTS_URL}/{self.event_id}/permissions/{self.participant['id']}",
-            json=update_data,
-            headers={"Authorization": f"Bearer {self.organizer_token}"}
+            **json_body(update_data),
+            timeout=TIMEOUT
         )
         
         if response.status_code == 200:
@@ -475,10 +532,10 @@ class IntegrationTest:
             "title": "Unauthorized Update by Viewer"
         }
         
-        response = requests.put(
+        response = self.participant_session.put(
             f"{EVENTS_URL}/{self.event_id}",
-            json=update_data,
-            headers={"Authorization": f"Bearer {self.participant_token}"}
+            **json_body(update_data),
+            timeout=TIMEOUT
         )
         
         if response.status_code == 403:
@@ -495,9 +552,9 @@ class IntegrationTest:
             )
         
         # Participant still can view event
-        response = requests.get(
+        response = self.participant_session.get(
             f"{EVENTS_URL}/{self.event_id}",
-            headers={"Authorization": f"Bearer {self.participant_token}"}
+            timeout=TIMEOUT
         )
         
         if response.status_code == 200:
@@ -514,9 +571,9 @@ class IntegrationTest:
             )
         
         # Remove participant's access entirely
-        response = requests.delete(
+        response = self.organizer_session.delete(
             f"{EVENTS_URL}/{self.event_id}/permissions/{self.participant['id']}",
-            headers={"Authorization": f"Bearer {self.organizer_token}"}
+            timeout=TIMEOUT
         )
         
         if response.status_code == 204:
@@ -534,9 +591,9 @@ class IntegrationTest:
             return
         
         # Participant tries to view event (should fail)
-        response = requests.get(
+        response = self.participant_session.get(
             f"{EVENTS_URL}/{self.event_id}",
-            headers={"Authorization": f"Bearer {self.participant_token}"}
+            timeout=TIMEOUT
         )
         
         if response.status_code == 403:
@@ -557,9 +614,9 @@ class IntegrationTest:
         print("\n🧹 STEP 8: CLEANUP\n")
         
         # Delete event
-        response = requests.delete(
+        response = self.organizer_session.delete(
             f"{EVENTS_URL}/{self.event_id}",
-            headers={"Authorization": f"Bearer {self.organizer_token}"}
+            timeout=TIMEOUT
         )
         
         if response.status_code == 204:
@@ -574,12 +631,15 @@ class IntegrationTest:
                 False, 
                 f"Failed to delete event: {response.status_code}"
             )
+        
+        for session in (self.session, self.admin_session, self.organizer_session, self.participant_session):
+            if session is not None:
+                session.close()
     
     def print_results(self):
         """Print test results summary."""
-        total = len(self.test_results)
-        passed = sum(1 for result in self.test_results if result["success"])
-        failed = total - passed
+        passed, failed = self.passed, self.failed
+        total = passed + failed
         
         print("\n📊 TEST RESULTS SUMMARY 📊")
         print(f"Total Tests: {total}")
@@ -587,16 +647,22 @@ class IntegrationTest:
         print(f"Failed: {failed}")
         print(f"Success Rate: {(passed/total)*100:.1f}%")
         
-        if failed > 0:
+        passed_tests, failed_tests = [], []
+        for result in self.test_results:
+            (passed_tests if result["success"] else failed_tests).append(result)
+        
+        if failed_tests:
             print("\n❌ FAILED TESTS:")
-            for result in self.test_results:
-                if not result["success"]:
-                    print(f"- {result['test']}: {result['message']}")
+            for result in failed_tests:
+                print(f"- {result['test']}: {result['message']}")
         
         print("\n✅ PASSED TESTS:")
-        for result in self.test_results:
-            if result["success"]:
-                print(f"- {result['test']}")
+        for result in passed_tests:
+            print(f"- {result['test']}")
+        
+        print("\n⏱️ STEP TIMINGS:")
+        for name, seconds in self.step_timings:
+            print(f"- {name}: {seconds * 1000:.1f} ms")
         
         print("\n" + "="*70)
         if failed == 0:
@@ -607,14 +673,14 @@ class IntegrationTest:
     
     def register_user(self, user_data: Dict[str, str]) -> Optional[Dict[str, Any]]:
         """Register a user and return user data if successful."""
-        response = requests.post(f"{AUTH_URL}/register", json=user_data)
+        response = self.session.post(f"{AUTH_URL}/register", **json_body(user_data), timeout=TIMEOUT)
         
         if response.status_code == 201:
-            return response.json()
+            return parse_json(response)
         else:
             print(f"Failed to register {user_data['username']}: {response.status_code}")
             try:
-                print(response.json())
+                print(parse_json(response))
             except:
                 print(response.text)
             return None
@@ -626,18 +692,19 @@ class IntegrationTest:
             "password": password
         }
         
-        response = requests.post(
+        response = self.session.post(
             f"{AUTH_URL}/login", 
             data=login_data,
-            headers={"Content-Type": "application/x-www-form-urlencoded"}
+            headers={"Content-Type": "application/x-www-form-urlencoded"},
+            timeout=TIMEOUT
         )
         
         if response.status_code == 200:
-            return response.json().get("access_token")
+            return parse_json(response).get("access_token")
         else:
             print(f"Failed to login {username}: {response.status_code}")
             try:
-                print(response.json())
+                print(parse_json(response))
             except:
                 print(response.text)
             return None
@@ -5,15 +5,20 @@ setup(
     version="0.1.0",
     packages=find_packages(),
     install_requires=[
-        "fastapi>=0.68.0,<0.69.0",
+        "fastapi>=0.100.0,<0.116.0",
         "uvicorn>=0.15.0,<0.16.0",
         "sqlalchemy>=1.4.23,<1.5.0",
-        "pydantic>=1.8.0,<2.0.0",
+        "pydantic>=2.0.0,<3.0.0",
+        "pydantic-settings>=2.7.0,<3.0.0",
+        "email-validator>=2.0.0,<3.0.0",
         "python-jose[cryptography]>=3.3.0,<3.4.0",
-        "passlib[bcrypt]>=1.7.4,<1.8.0",
+        "passlib[argon2,bcrypt]>=1.7.4,<1.8.0",
+        "argon2-cffi>=21.3.0",
         "python-multipart>=0.0.5,<0.0.6",
         "alembic>=1.7.1,<1.8.0",
         "psycopg2-binary>=2.9.1,<3.0.0",
         "python-dotenv>=0.19.0,<0.20.0",
+        "orjson>=3.6.0,<4.0.0",
+        "msgspec>=0.18.0,<1.0.0",
     ],
 )
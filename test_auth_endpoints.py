@@ -8,28 +8,39 @@ This script tests the authentication endpoints implemented in Day 1:
 - Logout
 """
 
+import atexit
+import os
 import requests
 import json
-from datetime import datetime
+import uuid
 
-# Base URL for our API
-BASE_URL = "http://localhost:8000/api/v1/auth"
+# Server under test; every test script reads TEST_SERVER_URL so one setting
+# points them all at another host or port. Defaults to uvicorn's bind address
+# (see test_event_endpoints.py for why it is not localhost).
+SERVER_URL = os.environ.get("TEST_SERVER_URL", "http://127.0.0.1:8000").rstrip("/")
+BASE_URL = f"{SERVER_URL}/api/v1/auth"
+
+# One session for the whole run so register -> login -> refresh -> logout
+# reuse a single keep-alive connection
+SESSION = requests.Session()
+atexit.register(SESSION.close)
 
 def test_register():
     """Test user registration endpoint."""
     print("\n===== Testing Register Endpoint =====")
     
-    # Test data
+    # Test data, with one random suffix so the email and username match
+    suffix = uuid.uuid4().hex[:8]
     user_data = {
-        "email": f"test{datetime.now().timestamp()}@example.com",
-        "username": f"testuser{int(datetime.now().timestamp())}",
+        "email": f"test{suffix}@example.com",
+        "username": f"testuser{suffix}",
         "password": "testpassword123"
     }
     
     print(f"Registering user: {user_data['username']}")
     
     # Send request
-    response = requests.post(f"{BASE_URL}/register", json=user_data)
+    response = SESSION.post(f"{BASE_URL}/register", json=user_data)
     
     # Print result
     print(f"Status code: {response.status_code}")
@@ -51,7 +62,7 @@ def test_login(username, password):
     print(f"Logging in as: {username}")
     
     # Send request
-    response = requests.post(
+    response = SESSION.post(
         f"{BASE_URL}/login", 
         data=login_data,  # Note: OAuth2 expects form data, not JSON
         headers={"Content-Type": "application/x-www-form-urlencoded"}
@@ -73,7 +84,7 @@ def test_refresh_token(token):
     print("Refreshing token")
     
     # Send request
-    response = requests.post(
+    response = SESSION.post(
         f"{BASE_URL}/refresh",
         headers={"Authorization": f"Bearer {token}"}
     )
@@ -94,7 +105,7 @@ def test_logout(token):
     print("Logging out")
     
     # Send request
-    response = requests.post(
+    response = SESSION.post(
         f"{BASE_URL}/logout",
         headers={"Authorization": f"Bearer {token}"}
     )
@@ -8,31 +8,133 @@ This script tests the event-related endpoints from Day 2 implementation:
 - Delete event
 - Event sharing
 - Version history
+- Batch creation with mixed naive and timezone-aware times
 """
 
 import requests
-import json
-from datetime import datetime, timedelta
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import orjson
+import os
+import sys
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
 
-# Base URL for our API
-BASE_URL = "http://localhost:8000/api/v1"
+# Server under test; every test script reads TEST_SERVER_URL so one setting
+# points them all at another host or port. The default is a literal address:
+# it skips the resolver, and matches uvicorn's default 127.0.0.1 bind where
+# localhost may resolve to ::1 first and fall back after a refused connect.
+SERVER_URL = os.environ.get("TEST_SERVER_URL", "http://127.0.0.1:8000").rstrip("/")
+BASE_URL = f"{SERVER_URL}/api/v1"
 AUTH_URL = f"{BASE_URL}/auth"
 EVENTS_URL = f"{BASE_URL}/events"
 
+# Pass -v to print full event bodies; by default only status lines are shown
+VERBOSE = "-v" in sys.argv[1:]
+
+# Pass --query-counts, against a server started with DEBUG=True, to check the
+# X-Query-Count header on these requests; each runs a fixed number of
+# statements however many events and permissions exist
+CHECK_QUERY_COUNTS = "--query-counts" in sys.argv[1:]
+QUERY_BUDGETS = {
+    "list": 2,
+    "detail": 3,
+    "shared detail": 4,
+    "share": 3,
+}
+
+# OAuth2 password login expects form data, not JSON
+LOGIN_HEADERS = {"Content-Type": "application/x-www-form-urlencoded"}
+
+# One random suffix per run: names match within a user and never collide
+# with an earlier run, however quickly runs follow each other
+_SUFFIX = uuid.uuid4().hex[:8]
+
 # Test user credentials
 TEST_USER = {
-    "email": f"testuser_{int(datetime.now().timestamp())}@example.com",
-    "username": f"testuser_{int(datetime.now().timestamp())}",
+    "email": f"testuser_{_SUFFIX}@example.com",
+    "username": f"testuser_{_SUFFIX}",
     "password": "TestPassword123"
 }
 
 # Test collaborator credentials
 TEST_COLLABORATOR = {
-    "email": f"collaborator_{int(datetime.now().timestamp())}@example.com",
-    "username": f"collaborator_{int(datetime.now().timestamp())}",
+    "email": f"collaborator_{_SUFFIX}@example.com",
+    "username": f"collaborator_{_SUFFIX}",
     "password": "CollabPassword123"
 }
 
+# (connect, read) seconds, so a hung server fails the run instead of stalling it
+TIMEOUT = (3.05, 10)
+
+def _new_session():
+    """
+    Create a pooled keep-alive session.
+    
+    Only failed connects are retried: those never reached the server, whereas
+    replaying a POST that did could register or create things twice.
+    """
+    session = requests.Session()
+    session.mount("http://", HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=10,
+        max_retries=Retry(total=3, connect=3, read=0, status=0, backoff_factor=0.1),
+    ))
+    return session
+
+# Keep-alive session for register/login, plus one per access token with its
+# Authorization header preset, so every call reuses a pooled connection
+SESSION = _new_session()
+_token_sessions = {}
+
+def session_for(token):
+    """Return the pooled session that authenticates as token."""
+    session = _token_sessions.get(token)
+    if session is None:
+        session = _new_session()
+        session.headers["Authorization"] = f"Bearer {token}"
+        _token_sessions[token] = session
+    return session
+
+def close_sessions():
+    """Close the shared and per-token sessions."""
+    SESSION.close()
+    for session in _token_sessions.values():
+        session.close()
+    _token_sessions.clear()
+
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+def json_body(value):
+    """Request keyword arguments sending value as an orjson-encoded JSON body."""
+    return {"data": orjson.dumps(value), "headers": JSON_HEADERS}
+
+def parse_json(response):
+    """Decode a response body with orjson."""
+    return orjson.loads(response.content)
+
+def print_body(label, value):
+    """Print a decoded response body, indented, when running with -v."""
+    if VERBOSE:
+        print(f"{label}: {orjson.dumps(value, option=orjson.OPT_INDENT_2).decode()}")
+
+def check_query_count(response, request_name):
+    """Check a response's statement count against its budget, if enabled."""
+    if not CHECK_QUERY_COUNTS:
+        return True
+    
+    budget = QUERY_BUDGETS[request_name]
+    count = response.headers.get("X-Query-Count")
+    if count is None:
+        print("❌ No X-Query-Count header; start the server with DEBUG=True")
+        return False
+    if int(count) > budget:
+        print(f"❌ {request_name} ran {count} queries, budget is {budget}")
+        return False
+    print(f"✅ {request_name} ran {count} queries (budget {budget})")
+    return True
+
 def print_separator():
     """Print a separator line."""
     print("=" * 70)
@@ -41,17 +143,14 @@ def register_user(user_data):
     """Register a test user."""
     print(f"Registering user: {user_data['username']}")
     
-    response = requests.post(f"{AUTH_URL}/register", json=user_data)
+    response = SESSION.post(f"{AUTH_URL}/register", **json_body(user_data), timeout=TIMEOUT)
     
     if response.status_code == 201:
         print(f"✅ User {user_data['username']} registered successfully")
-        return response.json()
+        return parse_json(response)
     else:
         print(f"❌ Failed to register user: {response.status_code}")
-        try:
-            print(response.json())
-        except:
-            print(response.text)
+        print(response.text)
         return None
 
 def login_user(username, password):
@@ -63,175 +162,159 @@ def login_user(username, password):
         "password": password
     }
     
-    response = requests.post(
+    response = SESSION.post(
         f"{AUTH_URL}/login", 
         data=login_data,
-        headers={"Content-Type": "application/x-www-form-urlencoded"}
+        headers=LOGIN_HEADERS,
+        timeout=TIMEOUT
     )
     
     if response.status_code == 200:
-        token = response.json().get("access_token")
+        token = parse_json(response).get("access_token")
         print(f"✅ Login successful, token received")
         return token
     else:
         print(f"❌ Login failed: {response.status_code}")
-        try:
-            print(response.json())
-        except:
-            print(response.text)
+        print(response.text)
         return None
 
 def create_event(token, event_data):
     """Create a new event."""
     print(f"Creating event: {event_data['title']}")
     
-    headers = {"Authorization": f"Bearer {token}"}
-    
-    response = requests.post(
+    response = session_for(token).post(
         EVENTS_URL,
-        json=event_data,
-        headers=headers
+        **json_body(event_data),
+        timeout=TIMEOUT
     )
     
     if response.status_code == 201:
         print(f"✅ Event created successfully")
-        return response.json()
+        return parse_json(response)
     else:
         print(f"❌ Failed to create event: {response.status_code}")
-        try:
-            print(response.json())
-        except:
-            print(response.text)
+        print(response.text)
         return None
 
 def get_events(token):
     """Get all events for current user."""
     print("Getting all events")
     
-    headers = {"Authorization": f"Bearer {token}"}
-    
-    response = requests.get(
+    response = session_for(token).get(
         EVENTS_URL,
-        headers=headers
+        timeout=TIMEOUT
     )
     
     if response.status_code == 200:
-        events = response.json()
+        events = parse_json(response)
         print(f"✅ Got {len(events)} events")
-        return events
+        return events if check_query_count(response, "list") else None
     else:
         print(f"❌ Failed to get events: {response.status_code}")
-        try:
-            print(response.json())
-        except:
-            print(response.text)
+        print(response.text)
         return None
 
-def get_event(token, event_id):
+def get_event(token, event_id, request_name="detail"):
     """Get a specific event by ID."""
     print(f"Getting event with ID: {event_id}")
     
-    headers = {"Authorization": f"Bearer {token}"}
-    
-    response = requests.get(
+    response = session_for(token).get(
         f"{EVENTS_URL}/{event_id}",
-        headers=headers
+        timeout=TIMEOUT
     )
     
     if response.status_code == 200:
         print(f"✅ Got event successfully")
-        return response.json()
+        return parse_json(response) if check_query_count(response, request_name) else None
     else:
         print(f"❌ Failed to get event: {response.status_code}")
-        try:
-            print(response.json())
-        except:
-            print(response.text)
+        print(response.text)
         return None
 
 def update_event(token, event_id, update_data):
     """Update an event."""
     print(f"Updating event {event_id} with: {update_data}")
     
-    headers = {"Authorization": f"Bearer {token}"}
-    
-    response = requests.put(
+    response = session_for(token).put(
         f"{EVENTS_URL}/{event_id}",
-        json=update_data,
-        headers=headers
+        **json_body(update_data),
+        timeout=TIMEOUT
     )
     
     if response.status_code == 200:
         print(f"✅ Event updated successfully")
-        return response.json()
+        return parse_json(response)
     else:
         print(f"❌ Failed to update event: {response.status_code}")
-        try:
-            print(response.json())
-        except:
-            print(response.text)
+        print(response.text)
         return None
 
 def share_event(token, event_id, user_id, role):
     """Share an event with another user."""
     print(f"Sharing event {event_id} with user {user_id}, role: {role}")
     
-    headers = {"Authorization": f"Bearer {token}"}
-    
     share_data = {
         "user_id": user_id,
         "role": role
     }
     
-    response = requests.post(
+    response = session_for(token).post(
         f"{EVENTS_URL}/{event_id}/share",
-        json=share_data,
-        headers=headers
+        **json_body(share_data),
+        timeout=TIMEOUT
     )
     
     if response.status_code == 200:
         print(f"✅ Event shared successfully")
-        return response.json()
+        return parse_json(response) if check_query_count(response, "share") else None
     else:
         print(f"❌ Failed to share event: {response.status_code}")
-        try:
-            print(response.json())
-        except:
-            print(response.text)
+        print(response.text)
         return None
 
 def get_event_history(token, event_id):
     """Get event version history."""
     print(f"Getting history for event {event_id}")
     
-    headers = {"Authorization": f"Bearer {token}"}
-    
-    response = requests.get(
+    response = session_for(token).get(
         f"{EVENTS_URL}/{event_id}/changelog",
-        headers=headers
+        timeout=TIMEOUT
     )
     
     if response.status_code == 200:
-        versions = response.json()
+        versions = parse_json(response)
         print(f"✅ Got {len(versions)} versions")
         return versions
     else:
         print(f"❌ Failed to get event history: {response.status_code}")
-        try:
-            print(response.json())
-        except:
-            print(response.text)
+        print(response.text)
         return None
 
+def create_batch(token, events, expected_status):
+    """Create events in one batch request and check the response status."""
+    print(f"Creating a batch of {len(events)} events, expecting {expected_status}")
+    
+    response = session_for(token).post(
+        f"{EVENTS_URL}/batch",
+        **json_body({"events": events}),
+        timeout=TIMEOUT
+    )
+    
+    if response.status_code == expected_status:
+        print(f"✅ Batch request returned {response.status_code}")
+        return True
+    else:
+        print(f"❌ Batch request returned {response.status_code}")
+        print(response.text)
+        return False
+
 def delete_event(token, event_id):
     """Delete an event."""
     print(f"Deleting event {event_id}")
     
-    headers = {"Authorization": f"Bearer {token}"}
-    
-    response = requests.delete(
+    response = session_for(token).delete(
         f"{EVENTS_URL}/{event_id}",
-        headers=headers
+        timeout=TIMEOUT
     )
     
     if response.status_code == 204:
@@ -239,21 +322,26 @@ def delete_event(token, event_id):
         return True
     else:
         print(f"❌ Failed to delete event: {response.status_code}")
-        try:
-            print(response.json())
-        except:
-            print(response.text)
+        print(response.text)
         return False
 
 def run_tests():
-    """Run all event endpoint tests."""
+    """Run all event endpoint tests, closing the HTTP sessions afterwards."""
+    try:
+        _run_steps()
+    finally:
+        close_sessions()
+
+def _run_steps():
+    """Run the event endpoint test steps in order."""
     print("\n🚀 STARTING EVENT ENDPOINT TESTS 🚀\n")
     
     # Step 1: Register users
     print_separator()
     print("STEP 1: REGISTER TEST USERS")
-    owner = register_user(TEST_USER)
-    collaborator = register_user(TEST_COLLABORATOR)
+    # Both users are independent, so register (and later log in) concurrently
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        owner, collaborator = executor.map(register_user, [TEST_USER, TEST_COLLABORATOR])
     
     if not owner or not collaborator:
         print("❌ Failed to register test users, aborting tests")
@@ -262,8 +350,12 @@ def run_tests():
     # Step 2: Login users
     print_separator()
     print("STEP 2: LOGIN USERS")
-    owner_token = login_user(TEST_USER["username"], TEST_USER["password"])
-    collaborator_token = login_user(TEST_COLLABORATOR["username"], TEST_COLLABORATOR["password"])
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        owner_token, collaborator_token = executor.map(
+            login_user,
+            [TEST_USER["username"], TEST_COLLABORATOR["username"]],
+            [TEST_USER["password"], TEST_COLLABORATOR["password"]],
+        )
     
     if not owner_token or not collaborator_token:
         print("❌ Failed to login, aborting tests")
@@ -309,7 +401,7 @@ def run_tests():
         print("❌ Failed to get event detail, aborting tests")
         return
     
-    print(f"Event details: {json.dumps(event_detail, indent=2)}")
+    print_body("Event details", event_detail)
     
     # Step 6: Update event
     print_separator()
@@ -325,7 +417,7 @@ def run_tests():
         print("❌ Failed to update event, aborting tests")
         return
     
-    print(f"Updated event: {json.dumps(updated_event, indent=2)}")
+    print_body("Updated event", updated_event)
     
     # Step 7: Share event with collaborator
     print_separator()
@@ -339,13 +431,13 @@ def run_tests():
     # Step 8: Collaborator views the shared event
     print_separator()
     print("STEP 8: COLLABORATOR VIEWS SHARED EVENT")
-    collab_view = get_event(collaborator_token, event_id)
+    collab_view = get_event(collaborator_token, event_id, "shared detail")
     
     if not collab_view:
         print("❌ Collaborator failed to view shared event, aborting tests")
         return
     
-    print(f"Collaborator can view the event: {json.dumps(collab_view, indent=2)}")
+    print_body("Collaborator can view the event", collab_view)
     
     # Step 9: Get event history
     print_separator()
@@ -358,9 +450,30 @@ def run_tests():
     
     print(f"Event has {len(history)} versions")
     
-    # Step 10: Delete event
+    # Step 10: Batch mixing naive and timezone-aware times. Naive times are
+    # read as UTC, so these compare instead of failing with a server error.
+    print_separator()
+    print("STEP 10: BATCH WITH MIXED TIMEZONES")
+    naive = (now + timedelta(days=3)).replace(microsecond=0)
+    aware = naive.replace(tzinfo=timezone.utc)
+    overlapping = [
+        {"title": "Naive Batch Event", "start_time": naive.isoformat(),
+         "end_time": (naive + timedelta(hours=2)).isoformat()},
+        {"title": "Aware Batch Event", "start_time": (aware + timedelta(hours=1)).isoformat(),
+         "end_time": (aware + timedelta(hours=3)).isoformat()},
+    ]
+    mixed = [
+        {"title": "Mixed Batch Event", "start_time": (naive + timedelta(days=1)).isoformat(),
+         "end_time": (aware + timedelta(days=1, hours=1)).isoformat()},
+    ]
+    
+    if not (create_batch(owner_token, overlapping, 409) and create_batch(owner_token, mixed, 201)):
+        print("❌ Batch with mixed timezones failed, aborting tests")
+        return
+    
+    # Step 11: Delete event
     print_separator()
-    print("STEP 10: DELETE EVENT")
+    print("STEP 11: DELETE EVENT")
     delete_result = delete_event(owner_token, event_id)
     
     if not delete_result: